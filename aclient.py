@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+Author   : Evan Elias Young
+Date     : 2026-10-18
+Revision : 2026-10-18
+"""
+
+from constants import *
+from typing import Optional, Union, List, Tuple, Dict, Any
+import asyncio
+import time
+import aiohttp
+from codec import loads
+from cache import Cache, cache_key
+from ratelimit import RateLimiter, DEFAULT_LIMITER
+from client import throttle_wait
+from identity import IdentityMap
+from singleflight import AsyncSingleFlight
+from metrics import Metrics, NULL_METRICS
+from results import iTunesResponse, iTunesResult
+from album import Album
+from artist import Artist
+from track import Track
+from wrapper import build_entity, search_params, parse_search
+
+
+class AsynciTunesClient:
+    """Represents a pooled, keep-alive asyncio connection to the iTunes store.
+    """
+    # The base url of the iTunes store.
+    base_url: str
+    # The number of pooled connections.
+    pool_size: int
+    # The connect and read timeouts, in seconds.
+    timeout: Tuple[float, float]
+    # The number of retries for failed requests.
+    retries: int
+    # The backoff factor between retries, in seconds.
+    backoff: float
+    # The semaphore bounding the requests in flight.
+    semaphore: asyncio.Semaphore
+    # The pooled session, created on the first request.
+    session: Optional[aiohttp.ClientSession]
+    # The response cache, if any.
+    cache: Optional[Cache]
+    # The rate limiter, if any.
+    limiter: Optional[RateLimiter]
+    # The entities shared across responses, if any.
+    identities: Optional[IdentityMap]
+    # The identical requests in flight.
+    flights: AsyncSingleFlight
+    # The metrics the requests are reported to.
+    metrics: Metrics
+
+    def __init__(self,
+                 base_url: str = ITUNES_URL,
+                 pool_size: int = POOL_SIZE,
+                 concurrency: int = ASYNC_CONCURRENCY,
+                 timeout: Tuple[float, float] = (CONNECT_TIMEOUT,
+                                                 READ_TIMEOUT),
+                 retries: int = RETRIES,
+                 backoff: float = RETRY_BACKOFF,
+                 cache: Optional[Cache] = None,
+                 limiter: Optional[RateLimiter] = DEFAULT_LIMITER,
+                 identities: Optional[IdentityMap] = None,
+                 metrics: Metrics = NULL_METRICS) -> None:
+        """Creates a client with its own connection pool.
+
+        Keyword Arguments:
+            base_url {str} -- The base url of the iTunes store. (default: {ITUNES_URL})
+            pool_size {int} -- The number of pooled connections. (default: {POOL_SIZE})
+            concurrency {int} -- The max number of requests in flight. (default: {ASYNC_CONCURRENCY})
+            timeout {Tuple[float, float]} -- The connect and read timeouts. (default: {(CONNECT_TIMEOUT, READ_TIMEOUT)})
+            retries {int} -- The number of retries for failed requests. (default: {RETRIES})
+            backoff {float} -- The backoff factor between retries. (default: {RETRY_BACKOFF})
+            cache {Optional[Cache]} -- The response cache. (default: {None})
+            limiter {Optional[RateLimiter]} -- The rate limiter shared with sync clients. (default: {DEFAULT_LIMITER})
+            identities {Optional[IdentityMap]} -- The entities shared across responses, None for one map per response. (default: {None})
+            metrics {Metrics} -- The metrics the requests are reported to. (default: {NULL_METRICS})
+        """
+        self.base_url = base_url.rstrip('/')
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.session = None
+        self.cache = cache
+        self.limiter = limiter
+        self.identities = identities
+        self.flights = AsyncSingleFlight()
+        self.metrics = metrics
+
+    def _session(self) -> aiohttp.ClientSession:
+        """Gets the pooled session, creating it inside the running loop.
+
+        Returns:
+            aiohttp.ClientSession -- The pooled session.
+        """
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size),
+                timeout=aiohttp.ClientTimeout(sock_connect=self.timeout[0],
+                                              sock_read=self.timeout[1]))
+        return self.session
+
+    async def get(self, endpoint: str, params: Dict[str, Any]) -> bytes:
+        """Sends a request to an iTunes endpoint.
+
+        Arguments:
+            endpoint {str} -- The endpoint name, such as search or lookup.
+            params {Dict[str, Any]} -- The query parameters.
+
+        Raises:
+            aiohttp.ClientResponseError: iTunes responded with an error status, or kept throttling.
+
+        Returns:
+            bytes -- The response body.
+        """
+        # The cache key for the request.
+        key: str = cache_key(endpoint, params)
+        # The cached response body.
+        body: Optional[bytes] = None
+        if self.cache is not None:
+            body = self.cache.get(key)
+            self.metrics.count('cache_hits' if body is not None else
+                               'cache_misses',
+                               endpoint=endpoint)
+        if body is not None:
+            return body
+        return await self.flights.do(
+            key, lambda: self._fetch(endpoint, params, key))
+
+    async def _fetch(self, endpoint: str, params: Dict[str, Any],
+                     key: str) -> bytes:
+        """Sends a request to an iTunes endpoint, bypassing the cache.
+
+        Arguments:
+            endpoint {str} -- The endpoint name, such as search or lookup.
+            params {Dict[str, Any]} -- The query parameters.
+            key {str} -- The cache key for the request.
+
+        Returns:
+            bytes -- The response body.
+        """
+        # The response body.
+        body: bytes
+        # The query parameters as strings.
+        query: Dict[str, str] = {k: str(v) for k, v in params.items()}
+        # The current attempt.
+        attempt: int = 0
+
+        while True:
+            if self.limiter is not None:
+                await asyncio.sleep(self.limiter.reserve())
+            try:
+                async with self.semaphore:
+                    # The time the request was sent.
+                    start: float = time.perf_counter()
+                    async with self._session().get(
+                            f'{self.base_url}/{endpoint}',
+                            params=query) as response:
+                        self.metrics.count('requests',
+                                           endpoint=endpoint,
+                                           status=str(response.status))
+                        self.metrics.observe('response_wait_seconds',
+                                             time.perf_counter() - start,
+                                             endpoint=endpoint)
+                        if response.status in THROTTLE_STATUSES and \
+                                attempt < self.retries:
+                            self.metrics.count('retries',
+                                               endpoint=endpoint,
+                                               reason='throttle')
+                            await throttle_wait(
+                                self.limiter,
+                                response.headers.get('Retry-After'), attempt,
+                                asyncio.sleep)
+                            attempt += 1
+                            continue
+                        if response.status < 500 or attempt >= self.retries:
+                            response.raise_for_status()
+                            if self.limiter is not None:
+                                self.limiter.succeeded()
+                            body = await response.read()
+                            self.metrics.count('bytes_received',
+                                               len(body),
+                                               endpoint=endpoint)
+                            self.metrics.observe('request_seconds',
+                                                 time.perf_counter() - start,
+                                                 endpoint=endpoint)
+                            if self.cache is not None:
+                                self.cache.set(key, body)
+                            return body
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt >= self.retries:
+                    raise
+            self.metrics.count('retries', endpoint=endpoint, reason='error')
+            await asyncio.sleep(self.backoff * (2**attempt))
+            attempt += 1
+
+    async def search(self, term: str, entity: str) -> iTunesResponse:
+        """Sends a search request with a given term and entity type.
+
+        Arguments:
+            term {str} -- The search term.
+            entity {str} -- The entity type(s).
+
+        Returns:
+            iTunesResponse -- The raw data returned by iTunes.
+        """
+        # The response body for the request.
+        body: bytes = await self.get('search', search_params(term, entity))
+        with self.metrics.timer('decode_seconds', endpoint='search'):
+            return parse_search(body)
+
+    async def search_entities(
+            self, term: str, entity: str) -> List[Union[Artist, Album, Track]]:
+        """Sends a search request with a given term and entity type.
+
+        Arguments:
+            term {str} -- The search term.
+            entity {str} -- The entity type(s).
+
+        Returns:
+            List[Union[Artist, Album, Track]] -- A list of entities returned by iTunes.
+        """
+        # Get the raw data.
+        data: iTunesResponse = await self.search(term, entity)
+        # The entities shared between the results.
+        idmap: IdentityMap = self.identities if self.identities is not None \
+            else IdentityMap()
+        with self.metrics.timer('build_seconds', endpoint='search'):
+            return [
+                build_entity(raw_ent, idmap) for raw_ent in data['results']
+            ]
+
+    async def lookup(self,
+                     uid: Union[int, str],
+                     entity: Optional[str] = None,
+                     limit: Optional[int] = None) -> List[iTunesResult]:
+        """Sends a lookup request and returns every result.
+
+        Arguments:
+            uid {Union[int, str]} -- The entity id, or comma-joined ids.
+
+        Keyword Arguments:
+            entity {Optional[str]} -- The related entity type(s) to return as well, such as album or song. (default: {None})
+            limit {Optional[int]} -- The max number of related results. (default: {None})
+
+        Returns:
+            List[iTunesResult] -- The raw data returned by iTunes, the looked up entities first.
+        """
+        # The lookup parameters.
+        params: Dict[str, Any] = {'id': uid}
+        if entity:
+            params['entity'] = entity
+        if limit:
+            params['limit'] = limit
+        # The response body for the request.
+        body: bytes = await self.get('lookup', params)
+        with self.metrics.timer('decode_seconds', endpoint='lookup'):
+            return loads(body)['results']
+
+    async def lookup_entity(
+            self, uid: int) -> Optional[Union[Artist, Album, Track]]:
+        """Sends a lookup request with a given id.
+
+        Arguments:
+            uid {int} -- The entity id.
+
+        Returns:
+            Optional[Union[Artist, Album, Track]] -- The entity returned by iTunes.
+        """
+        # Get the raw data.
+        data: Optional[iTunesResult] = None
+        try:
+            data = (await self.lookup(uid))[0]
+        except (IndexError, KeyError, ValueError):
+            # iTunes answered, but not with this id.
+            data = None
+        if not data:
+            return None
+        with self.metrics.timer('build_seconds', endpoint='lookup'):
+            return build_entity(data, self.identities)
+
+    def stats(self) -> Dict[str, float]:
+        """Gets the client counters.
+
+        Returns:
+            Dict[str, float] -- The requests sent and coalesced, with the cache counters if any.
+        """
+        # The client counters.
+        stats: Dict[str, float] = {
+            'requests': self.flights.executed,
+            'coalesced': self.flights.coalesced
+        }
+        if self.cache is not None:
+            stats.update({
+                f'cache_{k}': v
+                for k, v in self.cache.stats().items()
+            })
+        return stats
+
+    async def close(self) -> None:
+        """Closes every pooled connection.
+        """
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self) -> 'AsynciTunesClient':
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
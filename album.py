@@ -2,18 +2,24 @@
 """
 Author   : Evan Elias Young
 Date     : 2020-03-14
-Revision : 2020-03-14
+Revision : 2026-10-18
 """
 
 from constants import *
-from typing import Optional
+from typing import Optional, List, TYPE_CHECKING
 from typing_extensions import Protocol
 from datetime import datetime as dt
+from dates import Dated
 from results import AlbumResult, ArtistResult, TrackResult, iTunesResult
 from artist import Artist
+from identity import IdentityMap
 
+if TYPE_CHECKING:
+    # The track module imports this one.
+    from track import Track
 
-class Album:
+
+class Album(Dated):
     """Represents an iTunes Album.
     """
     # The raw data from iTunes.
@@ -30,45 +36,62 @@ class Album:
     copyright: str
     # The country where the album was released.
     country: str
-    # The release date of the album.
-    date: dt
+    # The release date of the album, as sent by iTunes.
+    release: str
     # The genre of the album.
     genre: str
+    # The tracks of the album, once expanded.
+    tracks: 'List[Track]'
 
     def __init__(self) -> None:
         self.type = 'Album'
 
     @staticmethod
-    def from_result(result: AlbumResult) -> 'Album':
-        album: Album = Album()
+    def from_result(result: AlbumResult,
+                    idmap: Optional[IdentityMap] = None) -> 'Album':
+        # The album, if already built from one of its tracks.
+        known: Optional[Album] = idmap.find(
+            'Album', result['collectionId']) if idmap is not None else None
+        # The album, filled in with the fuller album result.
+        album: Album = known if known is not None else Album()
 
         album.raw = result
-        album.artist = Artist.from_album_result(result)
+        album.artist = Artist.from_album_result(result, idmap)
         album.uid = result['collectionId']
         album.name = result['collectionCensoredName'] if CENSORED else result[
             'collectionName']
         album.trackCount = result['trackCount']
         album.copyright = result['copyright']
         album.country = result['country']
-        album.date = dt.strptime(result['releaseDate'], '%Y-%m-%dT%H:%M:%SZ')
+        album.set_release(result['releaseDate'])
         album.genre = result['primaryGenreName']
 
+        if idmap is not None:
+            idmap.put(album.type, album.uid, album)
         return album
 
     @staticmethod
-    def from_track_result(result: TrackResult) -> 'Album':
+    def from_track_result(result: TrackResult,
+                          idmap: Optional[IdentityMap] = None) -> 'Album':
+        # The album, if already built.
+        known: Optional[Album] = idmap.find(
+            'Album', result['collectionId']) if idmap is not None else None
+        if known is not None:
+            return known
         album: Album = Album()
 
         album.raw = result
-        album.artist = Artist.from_track_result(result)
+        album.artist = Artist.from_track_result(result, idmap)
         album.uid = result['collectionId']
         album.name = result['collectionCensoredName'] if CENSORED else result[
             'collectionName']
         album.trackCount = result['trackCount']
         album.country = result['country']
-        album.date = dt.strptime(result['releaseDate'], '%Y-%m-%dT%H:%M:%SZ')
+        album.set_release(result['releaseDate'])
         album.genre = result['primaryGenreName']
 
+        if idmap is not None:
+            idmap.put(album.type, album.uid, album)
         return album
 
     def __str__(self) -> str:
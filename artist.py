@@ -2,12 +2,18 @@
 """
 Author   : Evan Elias Young
 Date     : 2020-03-14
-Revision : 2020-03-14
+Revision : 2026-10-18
 """
 
 from constants import *
+from typing import Optional, List, TYPE_CHECKING
 from typing_extensions import Protocol
 from results import AlbumResult, ArtistResult, TrackResult, iTunesResult
+from identity import IdentityMap
+
+if TYPE_CHECKING:
+    # The album module imports this one.
+    from album import Album
 
 
 class Artist:
@@ -21,23 +27,38 @@ class Artist:
     name: str
     # The genre of the artist.
     genre: str
+    # The albums of the artist, once expanded.
+    albums: 'List[Album]'
 
     def __init__(self) -> None:
         self.type = 'Artist'
 
     @staticmethod
-    def from_result(result: ArtistResult) -> 'Artist':
-        artist: Artist = Artist()
+    def from_result(result: ArtistResult,
+                    idmap: Optional[IdentityMap] = None) -> 'Artist':
+        # The artist, if already built from one of its albums or tracks.
+        known: Optional[Artist] = idmap.find(
+            'Artist', result['artistId']) if idmap is not None else None
+        # The artist, filled in with the fuller artist result.
+        artist: Artist = known if known is not None else Artist()
 
         artist.raw = result
         artist.uid = result['artistId']
         artist.name = result['artistName']
         artist.genre = result['primaryGenreName']
 
+        if idmap is not None:
+            idmap.put(artist.type, artist.uid, artist)
         return artist
 
     @staticmethod
-    def from_album_result(result: AlbumResult) -> 'Artist':
+    def from_album_result(result: AlbumResult,
+                          idmap: Optional[IdentityMap] = None) -> 'Artist':
+        # The artist, if already built.
+        known: Optional[Artist] = idmap.find(
+            'Artist', result['artistId']) if idmap is not None else None
+        if known is not None:
+            return known
         artist: Artist = Artist()
 
         artist.raw = result
@@ -45,10 +66,18 @@ class Artist:
         artist.name = result['artistName']
         artist.genre = result['primaryGenreName']
 
+        if idmap is not None:
+            idmap.put(artist.type, artist.uid, artist)
         return artist
 
     @staticmethod
-    def from_track_result(result: TrackResult) -> 'Artist':
+    def from_track_result(result: TrackResult,
+                          idmap: Optional[IdentityMap] = None) -> 'Artist':
+        # The artist, if already built.
+        known: Optional[Artist] = idmap.find(
+            'Artist', result['artistId']) if idmap is not None else None
+        if known is not None:
+            return known
         artist: Artist = Artist()
 
         artist.raw = result
@@ -56,6 +85,8 @@ class Artist:
         artist.name = result['artistName']
         artist.genre = result['primaryGenreName']
 
+        if idmap is not None:
+            idmap.put(artist.type, artist.uid, artist)
         return artist
 
     def __str__(self) -> str:
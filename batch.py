@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Author   : Evan Elias Young
+Date     : 2026-10-18
+Revision : 2026-10-18
+"""
+
+from constants import *
+from typing import Optional, List, Dict, Set, Iterator, Iterable
+from typing import Tuple, TextIO, Any
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from concurrent.futures import FIRST_COMPLETED
+import argparse
+import json
+import sys
+import time
+from client import iTunesClient
+from ratelimit import RateLimiter
+from records import entity_record
+from wrapper import search_entities, lookup_entities_many, iter_chunk_ids
+
+
+def read_queries(stream: TextIO) -> Iterator[str]:
+    """Reads one query per line, skipping blank lines.
+
+    Arguments:
+        stream {TextIO} -- The input.
+
+    Returns:
+        Iterator[str] -- The queries.
+    """
+    for line in stream:
+        if line.strip():
+            yield line.strip()
+
+
+def read_ids(queries: Iterable[str], bad: List[str]) -> Iterator[int]:
+    """Parses ids, setting aside the ones that are not numbers.
+
+    Arguments:
+        queries {Iterable[str]} -- The queries.
+        bad {List[str]} -- The list to add the queries that are not ids to.
+
+    Returns:
+        Iterator[int] -- The ids.
+    """
+    for query in queries:
+        try:
+            yield int(query)
+        except ValueError:
+            bad.append(query)
+
+
+def run_queries(
+    jobs: Iterable[Tuple[List[str], Any]], executor: ThreadPoolExecutor,
+    inflight: int
+) -> Iterator[Tuple[List[str], Future]]:
+    """Runs jobs concurrently, yielding each one as soon as it is done.
+
+    Arguments:
+        jobs {Iterable[Tuple[List[str], Any]]} -- The queries and the function answering them.
+        executor {ThreadPoolExecutor} -- The executor running the jobs.
+        inflight {int} -- The max number of jobs submitted at once.
+
+    Returns:
+        Iterator[Tuple[List[str], Future]] -- The queries and finished future of each job, so a failed job does not stop the others.
+    """
+    # The running jobs and their queries.
+    running: Dict[Future, List[str]] = {}
+    for queries, func in jobs:
+        running[executor.submit(func)] = queries
+        while len(running) >= inflight:
+            done: Set[Future] = wait(running, return_when=FIRST_COMPLETED)[0]
+            for fut in done:
+                yield running.pop(fut), fut
+    for fut in list(running):
+        yield running.pop(fut), fut
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Runs searches or lookups from a file or stdin, printing NDJSON.
+
+    Keyword Arguments:
+        argv {Optional[List[str]]} -- The command line arguments. (default: {None})
+
+    Returns:
+        int -- The exit status.
+    """
+    # The command line parser.
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog='itules batch', description=DESCRIPTION)
+    parser.add_argument('mode',
+                        choices=['search', 'lookup'],
+                        help='search by term, or look up by id')
+    parser.add_argument('input',
+                        nargs='?',
+                        type=argparse.FileType('r'),
+                        default=sys.stdin,
+                        help='one term or id per line (default: stdin)')
+    parser.add_argument('-e',
+                        '--entity',
+                        default='song',
+                        help='the entity type(s) to search for')
+    parser.add_argument('-c',
+                        '--concurrency',
+                        type=int,
+                        default=POOL_SIZE,
+                        help='the max number of requests in flight')
+    parser.add_argument('-r',
+                        '--rate',
+                        type=float,
+                        default=RATE_LIMIT,
+                        help='the max requests per second, 0 for no limit')
+    parser.add_argument('--raw',
+                        action='store_true',
+                        help='include the raw iTunes data')
+    args: argparse.Namespace = parser.parse_args(argv)
+
+    # The client shared by every request.
+    client: iTunesClient = iTunesClient(
+        pool_size=args.concurrency,
+        limiter=RateLimiter(args.rate) if args.rate > 0 else None)
+    # The queries read from the input.
+    queries: Iterator[str] = read_queries(args.input)
+    # The queries that are not ids.
+    bad: List[str] = []
+    # The queries and the function answering them.
+    jobs: Iterable[Tuple[List[str], Any]]
+    if args.mode == 'search':
+        jobs = (([term], lambda term=term: search_entities(
+            term, args.entity, client)) for term in queries)
+    else:
+        jobs = (([str(uid) for uid in chunk], lambda chunk=chunk:
+                 lookup_entities_many(chunk, client).values())
+                for chunk in iter_chunk_ids(read_ids(queries, bad),
+                                            LOOKUP_CHUNK_SIZE))
+    # The counters of the run.
+    done: int = 0
+    entities: int = 0
+    missing: int = 0
+    errors: int = 0
+    # The time the run started.
+    start: float = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        for batch, fut in run_queries(jobs, executor, args.concurrency * 2):
+            done += len(batch)
+            # The entities answering the queries.
+            results: Iterable[Any]
+            try:
+                results = fut.result()
+            except (OSError, ValueError, KeyError) as err:
+                # Network, status and decode errors fail their queries only.
+                errors += len(batch)
+                print(f'\r{batch[0] if len(batch) == 1 else batch}: {err}',
+                      file=sys.stderr)
+                continue
+            for entity in results:
+                if entity is None:
+                    missing += 1
+                    continue
+                entities += 1
+                sys.stdout.write(
+                    json.dumps(entity_record(entity, args.raw)) + '\n')
+            sys.stdout.flush()
+            if not sys.stderr.isatty():
+                continue
+            # The seconds since the run started.
+            elapsed: float = time.perf_counter() - start
+            print(f'\r{done} queries, {entities} entities, '
+                  f'{entities / elapsed:.1f} entities/s',
+                  end='',
+                  file=sys.stderr)
+    for query in bad:
+        print(f'{query}: not an id', file=sys.stderr)
+    done += len(bad)
+    errors += len(bad)
+    # The seconds the run took.
+    total: float = time.perf_counter() - start
+    print(f'\r{done} queries, {entities} entities, {missing} missing, '
+          f'{errors} errors in '
+          f'{total:.2f}s ({done / total if total else 0:.1f} queries/s, '
+          f'{entities / total if total else 0:.1f} entities/s)',
+          file=sys.stderr)
+    return 1 if errors else 0
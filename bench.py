@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+"""
+Author   : Evan Elias Young
+Date     : 2026-10-18
+Revision : 2026-10-18
+"""
+
+from constants import *
+from typing import List, Dict, Callable, Iterator, Iterable, Any
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import timeit
+import tracemalloc
+from datetime import datetime as dt
+import dates
+from dates import parse_date
+from results import TrackResult, iTunesResult
+import wrapper
+from wrapper import derive_entity, build_entity, search, identities_for
+from identity import IdentityMap, EntityMemo
+from cache import LRUCache
+from compact import compact_entity
+from client import iTunesClient
+import codec
+from codec import loads
+from stubserver import StubServer, load_fixtures, replay_body
+
+# The search entity replaying each wrapper type.
+WRAPPER_ENTITIES: Dict[str, str] = {
+    'track': 'song',
+    'collection': 'album',
+    'artist': 'musicArtist'
+}
+
+
+def synthetic_results(count: int) -> List[TrackResult]:
+    """Builds realistic track results, 12 per album and 4 albums per artist.
+
+    Arguments:
+        count {int} -- The number of results.
+
+    Returns:
+        List[TrackResult] -- The track results.
+    """
+    return [{
+        'wrapperType': 'track',
+        'kind': 'song',
+        'artistId': 100000 + i // 48,
+        'collectionId': 200000 + i // 12,
+        'trackId': 300000 + i,
+        'artistName': f'Artist {i // 48}',
+        'collectionName': f'Album {i // 12}',
+        'trackName': f'Track {i}',
+        'collectionCensoredName': f'Album {i // 12}',
+        'trackCensoredName': f'Track {i}',
+        'artistViewUrl': f'https://music.apple.com/us/artist/{i // 48}',
+        'collectionViewUrl': f'https://music.apple.com/us/album/{i // 12}',
+        'trackViewUrl': f'https://music.apple.com/us/album/{i // 12}?i={i}',
+        'previewUrl': f'https://audio-ssl.itunes.apple.com/{i}.m4a',
+        'artworkUrl30': f'https://is1-ssl.mzstatic.com/{i // 12}/30x30bb.jpg',
+        'artworkUrl60': f'https://is1-ssl.mzstatic.com/{i // 12}/60x60bb.jpg',
+        'artworkUrl100':
+        f'https://is1-ssl.mzstatic.com/{i // 12}/100x100bb.jpg',
+        'collectionPrice': 9.99,
+        'trackPrice': 1.29,
+        'releaseDate': f'20{i % 20:02}-0{i % 9 + 1}-1{i % 10}T07:00:00Z',
+        'collectionExplicitness': 'notExplicit',
+        'trackExplicitness': 'notExplicit',
+        'discCount': 1,
+        'discNumber': 1,
+        'trackCount': 12,
+        'trackNumber': i % 12 + 1,
+        'trackTimeMillis': 180000 + i % 60000,
+        'country': 'USA',
+        'currency': 'USD',
+        'primaryGenreName': 'Rock',
+        'isStreamable': True
+    } for i in range(count)]
+
+
+def measure_memory(build: Callable[[], Any]) -> int:
+    """Measures the memory kept alive by the result of a function.
+
+    Arguments:
+        build {Callable[[], Any]} -- The function to measure.
+
+    Returns:
+        int -- The bytes allocated and still alive after the call.
+    """
+    tracemalloc.start()
+    # The result, kept alive until measured.
+    kept: Any = build()
+    # The bytes currently allocated.
+    size: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return size
+
+
+def bench_memory(count: int) -> Dict[str, int]:
+    """Compares the memory of the entity classes over synthetic results.
+
+    The raw results are built inside each measurement and then dropped, so
+    they only count against the models that keep them alive.
+
+    Arguments:
+        count {int} -- The number of results.
+
+    Returns:
+        Dict[str, int] -- The bytes kept alive per entity model.
+    """
+    return {
+        'classic':
+        measure_memory(lambda: [
+            derive_entity(r).from_result(r) for r in synthetic_results(count)
+        ]),
+        'shared':
+        measure_memory(lambda: [
+            build_entity(r, idmap) for idmap in [IdentityMap()]
+            for r in synthetic_results(count)
+        ]),
+        'compact':
+        measure_memory(
+            lambda: [compact_entity(r) for r in synthetic_results(count)]),
+        'compact_raw':
+        measure_memory(lambda: [
+            compact_entity(r, True) for r in synthetic_results(count)
+        ])
+    }
+
+
+def measure_time(func: Callable[[], Any], repeat: int = 50) -> float:
+    """Measures the best time of a function.
+
+    Arguments:
+        func {Callable[[], Any]} -- The function to measure.
+
+    Keyword Arguments:
+        repeat {int} -- The number of runs. (default: {50})
+
+    Returns:
+        float -- The fastest run, in microseconds.
+    """
+    return min(timeit.repeat(func, number=1, repeat=repeat)) * 1e6
+
+
+def bench_dates(count: int) -> Dict[str, float]:
+    """Compares the release date conversion of one page of results.
+
+    Arguments:
+        count {int} -- The number of results on the page.
+
+    Returns:
+        Dict[str, float] -- The microseconds per page per method.
+    """
+    # The release dates on the page.
+    texts: List[str] = [r['releaseDate'] for r in synthetic_results(count)]
+    # The results on the page.
+    results: List[TrackResult] = synthetic_results(count)
+
+    def parse_cold() -> None:
+        parse_date.cache_clear()
+        for text in texts:
+            parse_date(text)
+
+    def build(lazy: bool) -> Callable[[], Any]:
+
+        def run() -> Any:
+            dates.LAZY_DATES = lazy
+            parse_date.cache_clear()
+            return [build_entity(r) for r in results]
+
+        return run
+
+    # The timings per method.
+    timings: Dict[str, float] = {
+        'strptime':
+        measure_time(lambda: [
+            dt.strptime(text, '%Y-%m-%dT%H:%M:%SZ') for text in texts
+        ]),
+        'parse_cold':
+        measure_time(parse_cold),
+        'parse_warm':
+        measure_time(lambda: [parse_date(text) for text in texts]),
+        'build_eager':
+        measure_time(build(False)),
+        'build_lazy':
+        measure_time(build(True))
+    }
+    dates.LAZY_DATES = LAZY_DATES
+    return timings
+
+
+def bench_memo(count: int) -> Dict[str, float]:
+    """Compares serving one cached search response with and without a memo.
+
+    Arguments:
+        count {int} -- The number of results in the response.
+
+    Returns:
+        Dict[str, float] -- The microseconds per response per method.
+    """
+    with StubServer() as server:
+        # The client serving the response from its cache.
+        client: iTunesClient = iTunesClient(server.url,
+                                            cache=LRUCache(),
+                                            limiter=None)
+        # The entities of a search, warming the cache.
+        run: Callable[[], Any] = lambda: wrapper.search_entities(
+            'jack johnson', 'song', client, count)
+        run()
+        # The microseconds to decode and build the cached response.
+        build: float = measure_time(run)
+        wrapper.set_entity_memo(EntityMemo())
+        try:
+            run()
+            return {'build': build, 'memo': measure_time(run)}
+        finally:
+            wrapper.set_entity_memo(None)
+
+
+def measure_peak(func: Callable[[], Any]) -> int:
+    """Measures the peak memory allocated while a function runs.
+
+    Arguments:
+        func {Callable[[], Any]} -- The function to measure.
+
+    Returns:
+        int -- The peak bytes allocated during the call.
+    """
+    tracemalloc.start()
+    func()
+    # The peak bytes allocated.
+    peak: int = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def bench_repeat(count: int) -> int:
+    """Gets the number of runs to measure, fewer for larger responses.
+
+    Arguments:
+        count {int} -- The number of results.
+
+    Returns:
+        int -- The number of runs.
+    """
+    return max(3, min(50, 20000 // count))
+
+
+def bench_suite(
+        sizes: Iterable[int] = BENCH_SIZES) -> Iterator[Dict[str, Any]]:
+    """Replays recorded responses through a local stub server.
+
+    For each wrapper type and size, measures the end-to-end search latency,
+    the json decode time, the entity construction time and throughput, and
+    the peak memory of decoding and building a response.
+
+    Keyword Arguments:
+        sizes {Iterable[int]} -- The numbers of results. (default: {BENCH_SIZES})
+
+    Returns:
+        Iterator[Dict[str, Any]] -- One record per measurement.
+    """
+    # The details shared by every record.
+    meta: Dict[str, str] = {
+        'python': platform.python_version(),
+        'decoder': getattr(codec.decoder, '__module__', None) or 'json'
+    }
+    # The recorded results by wrapper type.
+    fixtures: Dict[str, iTunesResult] = load_fixtures()
+
+    with StubServer() as server:
+        # The client replaying the responses, without cache or limits.
+        client: iTunesClient = iTunesClient(server.url, limiter=None)
+        for wrapper_type, template in fixtures.items():
+            # The search entity returning the wrapper type.
+            entity: str = WRAPPER_ENTITIES[wrapper_type]
+            for count in sizes:
+                # The recorded response body.
+                body: bytes = replay_body(template, count)
+                # The raw results of the response.
+                results: List[iTunesResult] = loads(body)['results']
+                # The number of runs to measure.
+                repeat: int = bench_repeat(count)
+
+                def search_run() -> Any:
+                    # The entities shared between the results.
+                    idmap: IdentityMap = identities_for(client)
+                    return [
+                        build_entity(r, idmap) for r in search(
+                            'jack johnson', entity, client, limit=count)
+                        ['results']
+                    ]
+
+                # The microseconds to build every entity.
+                build: float = measure_time(
+                    lambda: [build_entity(r) for r in results], repeat)
+                # The measurements of the size.
+                values: Dict[str, Any] = {
+                    'search_us':
+                    measure_time(search_run, repeat),
+                    'decode_us':
+                    measure_time(lambda: loads(body), repeat),
+                    'build_us':
+                    build,
+                    'build_per_s':
+                    count / build * 1e6,
+                    'peak_bytes':
+                    measure_peak(lambda: [
+                        build_entity(r) for r in loads(body)['results']
+                    ]),
+                    'body_bytes':
+                    len(body)
+                }
+                for metric, value in values.items():
+                    yield {
+                        'metric': metric,
+                        'wrapper': wrapper_type,
+                        'results': count,
+                        'value': round(value, 1),
+                        **meta
+                    }
+        client.close()
+
+
+def measure_import(module: str, repeat: int = 10) -> float:
+    """Measures the best startup time of an interpreter importing a module.
+
+    Arguments:
+        module {str} -- The module, empty for a bare interpreter.
+
+    Keyword Arguments:
+        repeat {int} -- The number of runs. (default: {10})
+
+    Returns:
+        float -- The fastest run, in milliseconds.
+    """
+    # The directory holding the modules.
+    here: str = os.path.dirname(os.path.abspath(__file__))
+    # The command starting the interpreter.
+    command: List[str] = [
+        sys.executable, '-c', f'import {module}' if module else 'pass'
+    ]
+    return measure_time(lambda: subprocess.run(command, cwd=here, check=True),
+                        repeat) / 1000
+
+
+def bench_startup() -> Dict[str, float]:
+    """Compares the interactive startup and menu redraw costs.
+
+    The shell clear is what every redraw used to cost before clearing with
+    escape codes.
+
+    Returns:
+        Dict[str, float] -- The milliseconds per import or redraw.
+    """
+    from menus import print_header
+    from utils import align_dict, print_centered
+
+    def redraw() -> None:
+        with contextlib.redirect_stdout(io.StringIO()):
+            print_header()
+            print_centered('MAIN MENU')
+            for line in align_dict({'search': 'search', 'exit': 'exit'}):
+                print(line)
+
+    return {
+        'python': measure_import(''),
+        'menus': measure_import('menus'),
+        'wrapper': measure_import('wrapper'),
+        'redraw': measure_time(redraw) / 1000,
+        'shell_clear': measure_time(
+            lambda: os.system('cls >NUL' if os.name == 'nt' else
+                              'clear >/dev/null 2>&1'), 10) / 1000
+    }
+
+
+if __name__ == '__main__':
+    # The benchmark to run.
+    name: str = sys.argv[1] if len(sys.argv) > 1 else 'memory'
+    # The number of results to use.
+    count: int = int(sys.argv[2]) if len(sys.argv) > 2 else \
+        200 if name in ('dates', 'memo') else 100000
+    if name == 'suite':
+        for record in bench_suite(
+                [int(size) for size in sys.argv[2:]] or BENCH_SIZES):
+            print(json.dumps(record), flush=True)
+    elif name == 'startup':
+        for step, millis in bench_startup().items():
+            print(f'{step:{MAX_ID_LEN}}{SPACES}{millis:>12.3f} ms')
+    elif name == 'memo':
+        for method, micros in bench_memo(count).items():
+            print(f'{method:{MAX_ID_LEN}}{SPACES}{micros:>12.1f} us/page')
+    elif name == 'dates':
+        for method, micros in bench_dates(count).items():
+            print(f'{method:{MAX_ID_LEN}}{SPACES}{micros:>12.1f} us/page')
+    else:
+        for model, size in bench_memory(count).items():
+            print(f'{model:{MAX_ID_LEN}}{SPACES}{size:>12} B'
+                  f'{SPACES}{size / count:>8.1f} B/entity')
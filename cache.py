@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Author   : Evan Elias Young
+Date     : 2026-10-18
+Revision : 2026-10-18
+"""
+
+from constants import *
+from typing import Optional, Dict, Any, Tuple
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from urllib.parse import urlencode
+import sqlite3
+import threading
+import time
+
+
+def cache_key(endpoint: str, params: Dict[str, Any]) -> str:
+    """Builds the cache key of a request from its normalized parameters.
+
+    Arguments:
+        endpoint {str} -- The endpoint name, such as search or lookup.
+        params {Dict[str, Any]} -- The query parameters.
+
+    Returns:
+        str -- The cache key.
+    """
+    # The parameters as normalized strings.
+    norm: Dict[str, str] = {k: str(v).strip() for k, v in params.items()}
+    if 'term' in norm:
+        # iTunes ignores case and repeated whitespace in the term.
+        norm['term'] = ' '.join(norm['term'].lower().split())
+    return f'{endpoint}?{urlencode(sorted(norm.items()))}'
+
+
+class Cache(ABC):
+    """Represents a response cache with per-entry expiry.
+    """
+    # The default seconds an entry lives.
+    ttl: float
+    # The max number of entries kept.
+    max_entries: int
+    # The number of lookups answered by the cache.
+    hits: int
+    # The number of lookups not answered by the cache.
+    misses: int
+    # The lock guarding the entries and counters.
+    lock: threading.Lock
+
+    def __init__(self,
+                 ttl: float = CACHE_TTL,
+                 max_entries: int = CACHE_SIZE) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """Gets a live entry.
+
+        Arguments:
+            key {str} -- The cache key.
+
+        Returns:
+            Optional[bytes] -- The cached body, None if missing or expired.
+        """
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        """Stores an entry, evicting the least recently used if full.
+
+        Arguments:
+            key {str} -- The cache key.
+            value {bytes} -- The body to cache.
+
+        Keyword Arguments:
+            ttl {Optional[float]} -- The seconds the entry lives. (default: {None})
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Removes every entry.
+        """
+
+    def stats(self) -> Dict[str, float]:
+        """Gets the hit and miss counters.
+
+        Returns:
+            Dict[str, float] -- The hits, misses and hit rate.
+        """
+        # The total number of lookups.
+        total: int = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0
+        }
+
+
+class LRUCache(Cache):
+    """Represents an in-memory least recently used cache.
+    """
+
+    def __init__(self,
+                 ttl: float = CACHE_TTL,
+                 max_entries: int = CACHE_SIZE) -> None:
+        super().__init__(ttl, max_entries)
+        # The entries by key, oldest first, with their expiry times.
+        self.entries: 'OrderedDict[str, Tuple[float, bytes]]' = OrderedDict()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self.lock:
+            entry: Optional[Tuple[float, bytes]] = self.entries.get(key)
+            if entry is None or entry[0] < time.time():
+                if entry is not None:
+                    del self.entries[key]
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        with self.lock:
+            self.entries[key] = (time.time() +
+                                 (self.ttl if ttl is None else ttl), value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+class SQLiteCache(Cache):
+    """Represents an on-disk cache that survives restarts.
+    """
+    # The path to the database file.
+    path: str
+    # The connection to the database file.
+    conn: sqlite3.Connection
+
+    def __init__(self,
+                 path: str = CACHE_PATH,
+                 ttl: float = CACHE_TTL,
+                 max_entries: int = CACHE_SIZE) -> None:
+        super().__init__(ttl, max_entries)
+        self.path = path
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute('CREATE TABLE IF NOT EXISTS cache ('
+                          'key TEXT PRIMARY KEY, value BLOB NOT NULL, '
+                          'expires REAL NOT NULL, used REAL NOT NULL)')
+        self.conn.execute(
+            'CREATE INDEX IF NOT EXISTS cache_used ON cache (used)')
+        self.conn.commit()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self.lock:
+            # The current time.
+            now: float = time.time()
+            row: Optional[Tuple[bytes, float]] = self.conn.execute(
+                'SELECT value, expires FROM cache WHERE key = ?',
+                (key, )).fetchone()
+            if row is None or row[1] < now:
+                if row is not None:
+                    self.conn.execute('DELETE FROM cache WHERE key = ?',
+                                      (key, ))
+                    self.conn.commit()
+                self.misses += 1
+                return None
+            self.conn.execute('UPDATE cache SET used = ? WHERE key = ?',
+                              (now, key))
+            self.conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        with self.lock:
+            # The current time.
+            now: float = time.time()
+            self.conn.execute(
+                'INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?)',
+                (key, value, now + (self.ttl if ttl is None else ttl), now))
+            self.conn.execute(
+                'DELETE FROM cache WHERE key IN (SELECT key FROM cache '
+                'ORDER BY used DESC LIMIT -1 OFFSET ?)', (self.max_entries, ))
+            self.conn.commit()
+
+    def clear(self) -> None:
+        with self.lock:
+            self.conn.execute('DELETE FROM cache')
+            self.conn.commit()
+
+    def close(self) -> None:
+        """Closes the database file.
+        """
+        self.conn.close()
+
+    def __len__(self) -> int:
+        with self.lock:
+            return self.conn.execute(
+                'SELECT COUNT(*) FROM cache').fetchone()[0]
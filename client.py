@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+Author   : Evan Elias Young
+Date     : 2026-10-18
+Revision : 2026-10-18
+"""
+
+from constants import *
+from typing import Optional, Tuple, Dict, Iterator, Any, Callable
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from cache import Cache, cache_key
+from ratelimit import RateLimiter, DEFAULT_LIMITER, parse_retry_after
+from identity import IdentityMap
+from singleflight import SingleFlight
+from metrics import Metrics, NULL_METRICS
+import time
+
+
+class iTunesClient:
+    """Represents a pooled, keep-alive connection to the iTunes store.
+    """
+    # The base url of the iTunes store.
+    base_url: str
+    # The connect and read timeouts, in seconds.
+    timeout: Tuple[float, float]
+    # The pooled session shared by every request.
+    session: requests.Session
+    # The response cache, if any.
+    cache: Optional[Cache]
+    # The rate limiter, if any.
+    limiter: Optional[RateLimiter]
+    # The entities shared across responses, if any.
+    identities: Optional[IdentityMap]
+    # The number of retries after throttle responses.
+    retries: int
+    # The identical requests in flight.
+    flights: SingleFlight
+    # The metrics the requests are reported to.
+    metrics: Metrics
+
+    def __init__(self,
+                 base_url: str = ITUNES_URL,
+                 pool_size: int = POOL_SIZE,
+                 timeout: Tuple[float, float] = (CONNECT_TIMEOUT,
+                                                 READ_TIMEOUT),
+                 retries: int = RETRIES,
+                 backoff: float = RETRY_BACKOFF,
+                 cache: Optional[Cache] = None,
+                 limiter: Optional[RateLimiter] = DEFAULT_LIMITER,
+                 identities: Optional[IdentityMap] = None,
+                 metrics: Metrics = NULL_METRICS) -> None:
+        """Creates a client with its own connection pool.
+
+        Keyword Arguments:
+            base_url {str} -- The base url of the iTunes store. (default: {ITUNES_URL})
+            pool_size {int} -- The number of pooled connections. (default: {POOL_SIZE})
+            timeout {Tuple[float, float]} -- The connect and read timeouts. (default: {(CONNECT_TIMEOUT, READ_TIMEOUT)})
+            retries {int} -- The number of retries for failed requests. (default: {RETRIES})
+            backoff {float} -- The backoff factor between retries. (default: {RETRY_BACKOFF})
+            cache {Optional[Cache]} -- The response cache. (default: {None})
+            limiter {Optional[RateLimiter]} -- The rate limiter. (default: {DEFAULT_LIMITER})
+            identities {Optional[IdentityMap]} -- The entities shared across responses, None for one map per response. (default: {None})
+            metrics {Metrics} -- The metrics the requests are reported to. (default: {NULL_METRICS})
+        """
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.cache = cache
+        self.limiter = limiter
+        self.identities = identities
+        self.metrics = metrics
+        self.retries = retries
+        self.flights = SingleFlight()
+        self.session = requests.Session()
+        # The retry policy for connection errors and server failures,
+        # throttles are left to the rate limiter.
+        retry: Retry = Retry(total=retries,
+                             backoff_factor=backoff,
+                             status_forcelist=(500, 502, 503, 504),
+                             allowed_methods=frozenset(['GET']),
+                             respect_retry_after_header=False,
+                             raise_on_status=False)
+        # The adapter holding the connection pool.
+        adapter: HTTPAdapter = HTTPAdapter(pool_connections=pool_size,
+                                           pool_maxsize=pool_size,
+                                           max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def get(self, endpoint: str, params: Dict[str, Any]) -> bytes:
+        """Sends a request to an iTunes endpoint.
+
+        Arguments:
+            endpoint {str} -- The endpoint name, such as search or lookup.
+            params {Dict[str, Any]} -- The query parameters.
+
+        Raises:
+            requests.HTTPError: iTunes responded with an error status, or kept throttling.
+
+        Returns:
+            bytes -- The response body.
+        """
+        # The cache key for the request.
+        key: str = cache_key(endpoint, params)
+        # The cached response body.
+        body: Optional[bytes] = None
+        if self.cache is not None:
+            body = self.cache.get(key)
+            self.metrics.count('cache_hits' if body is not None else
+                               'cache_misses',
+                               endpoint=endpoint)
+        if body is not None:
+            return body
+        return self.flights.do(key, lambda: self._fetch(endpoint, params, key))
+
+    def _fetch(self, endpoint: str, params: Dict[str, Any], key: str) -> bytes:
+        """Sends a request to an iTunes endpoint, bypassing the cache.
+
+        Arguments:
+            endpoint {str} -- The endpoint name, such as search or lookup.
+            params {Dict[str, Any]} -- The query parameters.
+            key {str} -- The cache key for the request.
+
+        Returns:
+            bytes -- The response body.
+        """
+        # The response for the request.
+        response: requests.Response = self._send(endpoint, params)
+        if self.cache is not None:
+            self.cache.set(key, response.content)
+        return response.content
+
+    def stream(self,
+               endpoint: str,
+               params: Dict[str, Any],
+               chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+        """Sends a request, yielding the body as it downloads.
+
+        A cached body is yielded whole. A streamed body is neither cached nor
+        shared with identical requests, as both would mean holding it whole.
+
+        Arguments:
+            endpoint {str} -- The endpoint name, such as search or lookup.
+            params {Dict[str, Any]} -- The query parameters.
+
+        Keyword Arguments:
+            chunk_size {int} -- The max bytes per chunk. (default: {STREAM_CHUNK_SIZE})
+
+        Raises:
+            requests.HTTPError: iTunes responded with an error status, or kept throttling.
+
+        Returns:
+            Iterator[bytes] -- The chunks of the response body.
+        """
+        # The cached response body.
+        body: Optional[bytes] = None
+        if self.cache is not None:
+            body = self.cache.get(cache_key(endpoint, params))
+            self.metrics.count('cache_hits' if body is not None else
+                               'cache_misses',
+                               endpoint=endpoint)
+        if body is not None:
+            yield body
+            return
+        # The time the request was sent.
+        start: float = time.perf_counter()
+        # The bytes received so far.
+        size: int = 0
+        with self._send(endpoint, params, True) as response:
+            for chunk in response.iter_content(chunk_size):
+                size += len(chunk)
+                yield chunk
+        self.report_body(endpoint, size, time.perf_counter() - start)
+
+    def _send(self,
+              endpoint: str,
+              params: Dict[str, Any],
+              stream: bool = False) -> requests.Response:
+        """Sends a request to an iTunes endpoint, waiting out throttles.
+
+        Arguments:
+            endpoint {str} -- The endpoint name, such as search or lookup.
+            params {Dict[str, Any]} -- The query parameters.
+
+        Keyword Arguments:
+            stream {bool} -- Whether or not to leave the body to download. (default: {False})
+
+        Raises:
+            requests.HTTPError: iTunes responded with an error status, or kept throttling.
+
+        Returns:
+            requests.Response -- The successful response.
+        """
+        # The response for the request.
+        response: requests.Response
+        # The current attempt.
+        attempt: int = 0
+
+        while True:
+            if self.limiter is not None:
+                self.limiter.acquire()
+            # The time the request was sent.
+            start: float = time.perf_counter()
+            response = self.session.get(f'{self.base_url}/{endpoint}',
+                                        params=params,
+                                        timeout=self.timeout,
+                                        stream=stream)
+            self.report(endpoint, response)
+            if not stream:
+                self.report_body(endpoint, len(response.content),
+                                 time.perf_counter() - start)
+            if response.status_code not in THROTTLE_STATUSES or \
+                    attempt >= self.retries:
+                break
+            response.close()
+            self.metrics.count('retries', endpoint=endpoint, reason='throttle')
+            throttle_wait(self.limiter,
+                          response.headers.get('Retry-After'), attempt,
+                          time.sleep)
+            attempt += 1
+        try:
+            response.raise_for_status()
+        except requests.HTTPError:
+            response.close()
+            raise
+        if self.limiter is not None:
+            self.limiter.succeeded()
+        return response
+
+    def report(self, endpoint: str, response: requests.Response) -> None:
+        """Reports the status and headers of a response to the metrics.
+
+        Arguments:
+            endpoint {str} -- The endpoint name, such as search or lookup.
+            response {requests.Response} -- The response.
+        """
+        # The retries of server failures done by the adapter.
+        retries: Optional[Retry] = getattr(response.raw, 'retries', None)
+        if retries is not None and retries.history:
+            self.metrics.count('retries',
+                               len(retries.history),
+                               endpoint=endpoint,
+                               reason='error')
+        self.metrics.count('requests',
+                           endpoint=endpoint,
+                           status=str(response.status_code))
+        # The seconds until the headers, the rest went to the body.
+        self.metrics.observe('response_wait_seconds',
+                             response.elapsed.total_seconds(),
+                             endpoint=endpoint)
+
+    def report_body(self, endpoint: str, size: int, seconds: float) -> None:
+        """Reports a downloaded response body to the metrics.
+
+        Arguments:
+            endpoint {str} -- The endpoint name, such as search or lookup.
+            size {int} -- The bytes received.
+            seconds {float} -- The seconds from sending to the whole body.
+        """
+        self.metrics.count('bytes_received', size, endpoint=endpoint)
+        self.metrics.observe('request_seconds', seconds, endpoint=endpoint)
+
+    def warm_up(self) -> None:
+        """Opens a pooled connection ahead of the first request.
+
+        Failures are ignored, the first request will simply connect itself.
+        """
+        try:
+            self.session.head(self.base_url, timeout=self.timeout).close()
+        except requests.RequestException:
+            pass
+
+    def stats(self) -> Dict[str, float]:
+        """Gets the client counters.
+
+        Returns:
+            Dict[str, float] -- The requests sent and coalesced, with the cache counters if any.
+        """
+        # The client counters.
+        stats: Dict[str, float] = {
+            'requests': self.flights.executed,
+            'coalesced': self.flights.coalesced
+        }
+        if self.cache is not None:
+            stats.update({
+                f'cache_{k}': v
+                for k, v in self.cache.stats().items()
+            })
+        return stats
+
+    def close(self) -> None:
+        """Closes every pooled connection.
+        """
+        self.session.close()
+
+    def __enter__(self) -> 'iTunesClient':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+def throttle_wait(limiter: Optional[RateLimiter], retry_after: Optional[str],
+                  attempt: int, sleep: Callable[[float], Any]) -> Any:
+    """Backs off after a throttle response.
+
+    Arguments:
+        limiter {Optional[RateLimiter]} -- The rate limiter, if any.
+        retry_after {Optional[str]} -- The Retry-After header, if any.
+        attempt {int} -- The attempt that was throttled.
+        sleep {Callable[[float], Any]} -- The function used to wait.
+
+    Returns:
+        Any -- The result of the sleep function.
+    """
+    # The seconds iTunes asked to wait.
+    delay: Optional[float] = parse_retry_after(retry_after)
+    if limiter is not None:
+        # The limiter pauses every caller, the next acquire waits it out.
+        limiter.throttled(delay)
+        return sleep(0)
+    return sleep(delay if delay is not None else THROTTLE_BACKOFF * 2**attempt)
+
+
+# The client used when no other client is given.
+DEFAULT_CLIENT: iTunesClient = iTunesClient()
+
+
+def get_client(client: Optional[iTunesClient] = None) -> iTunesClient:
+    """Gets the given client, or the default client.
+
+    Keyword Arguments:
+        client {Optional[iTunesClient]} -- The client to use. (default: {None})
+
+    Returns:
+        iTunesClient -- The client to send requests with.
+    """
+    return client if client is not None else DEFAULT_CLIENT
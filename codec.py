@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Author   : Evan Elias Young
+Date     : 2026-10-18
+Revision : 2026-10-18
+"""
+
+from typing import Optional, Callable, Any
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# The function turning response bytes into json data.
+decoder: Callable[[bytes], Any] = orjson.loads if orjson else json.loads
+
+
+def set_decoder(func: Optional[Callable[[bytes], Any]] = None) -> None:
+    """Sets the json decoder used for every response.
+
+    Keyword Arguments:
+        func {Optional[Callable[[bytes], Any]]} -- The decoder, None for the fastest installed one. (default: {None})
+    """
+    global decoder
+    decoder = func if func else orjson.loads if orjson else json.loads
+
+
+def loads(body: bytes) -> Any:
+    """Decodes the json data of a response body.
+
+    Arguments:
+        body {bytes} -- The response body, as json or JSONP.
+
+    Returns:
+        Any -- The json data.
+    """
+    # The index of the first json character.
+    start: int = body.find(b'{')
+    if start > 0 and body.find(b'(', 0, start) >= 0:
+        # Strip the JSONP callback wrapped around the data.
+        body = body[start:body.rindex(b')')]
+    return decoder(body)
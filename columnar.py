@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Author   : Evan Elias Young
+Date     : 2026-10-18
+Revision : 2026-10-18
+"""
+
+from constants import *
+from typing import Optional, Union, List, Dict, Iterable, Any, Type
+from array import array
+from results import AlbumResult, ArtistResult, TrackResult, iTunesResult
+from dates import parse_timestamp
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+# The result schema of each wrapper type.
+SCHEMAS: Dict[str, Type[Any]] = {
+    'collection': AlbumResult,
+    'artist': ArtistResult,
+    'track': TrackResult
+}
+# The array type codes of the typed fields, strings are kept as lists.
+TYPE_CODES: Dict[type, str] = {int: 'q', float: 'd', bool: 'b'}
+# The NumPy types of the array type codes.
+NUMPY_TYPES: Dict[Optional[str], str] = {
+    'q': 'int64',
+    'd': 'float64',
+    'b': 'int8'
+}
+# The fields holding dates, stored as seconds since the epoch.
+DATE_FIELDS: List[str] = ['releaseDate']
+
+
+class Column:
+    """Represents one field of many results.
+    """
+    # The field name.
+    name: str
+    # The array type code, None for strings.
+    code: Optional[str]
+    # Whether or not the values are seconds since the epoch.
+    timestamp: bool
+    # The values, zero or None where missing.
+    values: Union['array[Any]', List[Optional[str]]]
+    # Whether or not each value is present.
+    valid: bytearray
+
+    def __init__(self, name: str, kind: type,
+                 raw: List[Optional[Any]]) -> None:
+        """Builds a column from the raw values of one field.
+
+        Arguments:
+            name {str} -- The field name.
+            kind {type} -- The field type from the result schema.
+            raw {List[Optional[Any]]} -- The raw values, None where missing.
+        """
+        self.name = name
+        self.timestamp = name in DATE_FIELDS
+        self.valid = bytearray(v is not None for v in raw)
+        if self.timestamp:
+            self.code = 'q'
+            self.values = array(
+                'q', (parse_timestamp(v) if v is not None else 0 for v in raw))
+        elif kind in TYPE_CODES:
+            self.code = TYPE_CODES[kind]
+            # iTunes sends whole prices as ints, so cast to the schema type.
+            self.values = array(self.code,
+                                (kind(v) if v is not None else 0 for v in raw))
+        else:
+            self.code = None
+            self.values = raw
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+def to_columns(results: Iterable[iTunesResult],
+               wrapper_type: str = 'track') -> Dict[str, Column]:
+    """Turns raw results of one wrapper type into typed columns.
+
+    Arguments:
+        results {Iterable[iTunesResult]} -- The raw data returned by iTunes.
+
+    Keyword Arguments:
+        wrapper_type {str} -- The wrapper type to keep, others are skipped. (default: {'track'})
+
+    Returns:
+        Dict[str, Column] -- The columns by field name, in schema order.
+    """
+    # The results of the wrapper type.
+    rows: List[iTunesResult] = [
+        r for r in results if r.get('wrapperType') == wrapper_type
+    ]
+    return {
+        field: Column(field, kind, [r.get(field) for r in rows])
+        for field, kind in SCHEMAS[wrapper_type].__annotations__.items()
+    }
+
+
+def numpy_values(col: Column) -> Any:
+    """Views the values of a typed column as a NumPy array, without copying.
+
+    Arguments:
+        col {Column} -- The typed column.
+
+    Returns:
+        numpy.ndarray -- The values.
+    """
+    # The values, sharing the column's memory.
+    values: Any = np.frombuffer(col.values, dtype=NUMPY_TYPES[col.code])
+    if col.code == 'b':
+        return values.view(bool)
+    elif col.timestamp:
+        return values.view('datetime64[s]')
+    return values
+
+
+def to_numpy(columns: Dict[str, Column]) -> Dict[str, Any]:
+    """Turns columns into NumPy arrays.
+
+    Arguments:
+        columns {Dict[str, Column]} -- The columns.
+
+    Raises:
+        ImportError: NumPy is not installed.
+
+    Returns:
+        Dict[str, Any] -- The arrays by field name, masked where values are missing.
+    """
+    if np is None:
+        raise ImportError('to_numpy requires numpy')
+    # The arrays by field name.
+    arrays: Dict[str, Any] = {}
+
+    for name, col in columns.items():
+        if col.code is None:
+            arrays[name] = np.array(col.values, dtype=object)
+        elif all(col.valid):
+            arrays[name] = numpy_values(col)
+        else:
+            arrays[name] = np.ma.MaskedArray(
+                numpy_values(col),
+                mask=~np.frombuffer(col.valid, dtype=bool))
+    return arrays
+
+
+def to_arrow(columns: Dict[str, Column]) -> Any:
+    """Turns columns into an Arrow table.
+
+    Arguments:
+        columns {Dict[str, Column]} -- The columns.
+
+    Raises:
+        ImportError: PyArrow is not installed.
+
+    Returns:
+        pyarrow.Table -- The table.
+    """
+    if pa is None:
+        raise ImportError('to_arrow requires pyarrow')
+    # The Arrow types of the array type codes.
+    types: Dict[Optional[str], Any] = {
+        'q': pa.int64(),
+        'd': pa.float64(),
+        'b': pa.bool_(),
+        None: pa.string()
+    }
+    # The arrays in column order.
+    arrays: List[Any] = []
+
+    for col in columns.values():
+        # The Arrow type of the column.
+        kind: Any = pa.timestamp('s', tz='UTC') if col.timestamp \
+            else types[col.code]
+        # The values, zero-copy when NumPy is installed.
+        values: Any = col.values
+        if col.code is not None and np is not None:
+            values = np.frombuffer(col.values, dtype=NUMPY_TYPES[col.code])
+            if col.code == 'b':
+                values = values.view(bool)
+        elif col.code is not None:
+            values = [bool(v) for v in col.values] if col.code == 'b' \
+                else col.values.tolist()
+        # The missing values, None when every value is present.
+        mask: Any = None
+        if not all(col.valid):
+            mask = ~np.frombuffer(col.valid, dtype=bool) if np is not None \
+                else pa.array([not v for v in col.valid], pa.bool_())
+        arrays.append(pa.array(values, types[col.code], mask=mask).cast(kind))
+    return pa.Table.from_arrays(arrays, names=list(columns))
+
+
+def write_parquet(results: Iterable[iTunesResult],
+                  path: str,
+                  wrapper_type: str = 'track') -> int:
+    """Writes raw results of one wrapper type to a Parquet file.
+
+    Arguments:
+        results {Iterable[iTunesResult]} -- The raw data returned by iTunes.
+        path {str} -- The path of the Parquet file.
+
+    Keyword Arguments:
+        wrapper_type {str} -- The wrapper type to keep, others are skipped. (default: {'track'})
+
+    Raises:
+        ImportError: PyArrow is not installed.
+
+    Returns:
+        int -- The number of rows written.
+    """
+    if pq is None:
+        raise ImportError('write_parquet requires pyarrow')
+    # The table to write.
+    table: Any = to_arrow(to_columns(results, wrapper_type))
+    pq.write_table(table, path)
+    return table.num_rows
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Author   : Evan Elias Young
+Date     : 2026-10-18
+Revision : 2026-10-18
+"""
+
+from constants import *
+from typing import Optional, Union, Dict, Type
+from results import AlbumResult, ArtistResult, TrackResult, iTunesResult
+from results import result_kind
+from identity import IdentityMap
+from dates import Dated
+
+
+class CompactArtist:
+    """Represents an iTunes Artist without a per-instance dict.
+    """
+    __slots__ = ('raw', 'uid', 'name', 'genre')
+    type: str = 'Artist'
+    # The raw data from iTunes, if kept.
+    raw: Optional[iTunesResult]
+    # The artist id.
+    uid: int
+    # The name of the artist.
+    name: str
+    # The genre of the artist.
+    genre: str
+
+    @staticmethod
+    def from_result(result: Union[ArtistResult, AlbumResult, TrackResult],
+                    keep_raw: bool = False,
+                    idmap: Optional[IdentityMap] = None) -> 'CompactArtist':
+        # The artist, if already built.
+        known: Optional[CompactArtist] = idmap.find(
+            'Artist', result['artistId']) if idmap is not None else None
+        if known is not None and result.get('wrapperType') != 'artist':
+            return known
+        # The artist, filled in with the fuller artist result if known.
+        artist: CompactArtist = known if known is not None else CompactArtist()
+
+        artist.raw = result if keep_raw else None
+        artist.uid = result['artistId']
+        artist.name = result['artistName']
+        artist.genre = result['primaryGenreName']
+
+        if idmap is not None:
+            idmap.put(artist.type, artist.uid, artist)
+        return artist
+
+    from_album_result = from_result
+    from_track_result = from_result
+
+    def __str__(self) -> str:
+        return self.name
+
+
+class CompactAlbum(Dated):
+    """Represents an iTunes Album without a per-instance dict.
+    """
+    __slots__ = ('raw', 'artist', 'uid', 'name', 'trackCount', 'copyright',
+                 'country', 'release', '_date', 'genre')
+    type: str = 'Album'
+    # The raw data from iTunes, if kept.
+    raw: Optional[iTunesResult]
+    # The artist of the album.
+    artist: CompactArtist
+    # The album id.
+    uid: int
+    # The name of the album.
+    name: str
+    # The number of tracks in the album.
+    trackCount: int
+    # The copyright information of the album, if known.
+    copyright: Optional[str]
+    # The country where the album was released.
+    country: str
+    # The release date of the album, as sent by iTunes.
+    release: str
+    # The genre of the album.
+    genre: str
+
+    @staticmethod
+    def from_result(result: Union[AlbumResult, TrackResult],
+                    keep_raw: bool = False,
+                    idmap: Optional[IdentityMap] = None) -> 'CompactAlbum':
+        # The album, if already built from one of its tracks.
+        known: Optional[CompactAlbum] = idmap.find(
+            'Album', result['collectionId']) if idmap is not None else None
+        # The album, filled in with the fuller album result.
+        album: CompactAlbum = known if known is not None else CompactAlbum()
+        album.fill(result, keep_raw, idmap)
+        return album
+
+    @staticmethod
+    def from_track_result(
+            result: TrackResult,
+            keep_raw: bool = False,
+            idmap: Optional[IdentityMap] = None) -> 'CompactAlbum':
+        # The album, if already built.
+        known: Optional[CompactAlbum] = idmap.find(
+            'Album', result['collectionId']) if idmap is not None else None
+        if known is not None:
+            return known
+        # The album, built from the track.
+        album: CompactAlbum = CompactAlbum()
+        album.fill(result, keep_raw, idmap)
+        return album
+
+    def fill(self,
+             result: Union[AlbumResult, TrackResult],
+             keep_raw: bool = False,
+             idmap: Optional[IdentityMap] = None) -> None:
+        """Sets the fields of the album from a result, and registers it.
+
+        Arguments:
+            result {Union[AlbumResult, TrackResult]} -- The raw data returned by iTunes.
+
+        Keyword Arguments:
+            keep_raw {bool} -- Whether or not to keep the raw data. (default: {False})
+            idmap {Optional[IdentityMap]} -- The entities to share parents with. (default: {None})
+        """
+        self.raw = result if keep_raw else None
+        self.artist = CompactArtist.from_result(result, False, idmap)
+        self.uid = result['collectionId']
+        self.name = result['collectionCensoredName'] if CENSORED else result[
+            'collectionName']
+        self.trackCount = result['trackCount']
+        self.copyright = result.get('copyright')
+        self.country = result['country']
+        self.set_release(result['releaseDate'])
+        self.genre = result['primaryGenreName']
+
+        if idmap is not None:
+            idmap.put(self.type, self.uid, self)
+
+    def __str__(self) -> str:
+        return self.name
+
+
+class CompactTrack(Dated):
+    """Represents an iTunes Track without a per-instance dict.
+    """
+    __slots__ = ('raw', 'artist', 'album', 'uid', 'name', 'country',
+                 'release', '_date', 'time', 'genre')
+    type: str = 'Track'
+    # The raw data from iTunes, if kept.
+    raw: Optional[iTunesResult]
+    # The artist of the track.
+    artist: CompactArtist
+    # The album of the track.
+    album: CompactAlbum
+    # The track id.
+    uid: int
+    # The name of the track.
+    name: str
+    # The country where the album was released.
+    country: str
+    # The release date of the album, as sent by iTunes.
+    release: str
+    # The length of the track in seconds.
+    time: float
+    # The genre of the track.
+    genre: str
+
+    @staticmethod
+    def from_result(result: TrackResult,
+                    keep_raw: bool = False,
+                    idmap: Optional[IdentityMap] = None) -> 'CompactTrack':
+        track: CompactTrack = CompactTrack()
+
+        track.raw = result if keep_raw else None
+        track.album = CompactAlbum.from_track_result(result, False, idmap)
+        # The album already holds the same artist.
+        track.artist = track.album.artist
+        track.uid = result['trackId']
+        track.name = result['trackCensoredName'] if CENSORED else result[
+            'trackName']
+        track.country = result['country']
+        track.set_release(result['releaseDate'])
+        track.time = result['trackTimeMillis'] / 1000
+        track.genre = result['primaryGenreName']
+
+        if idmap is not None:
+            idmap.put(track.type, track.uid, track)
+        return track
+
+    def __str__(self) -> str:
+        return self.name
+
+
+# The compact class built for each wrapper type.
+COMPACT_TYPES: Dict[str, Type[Union[CompactArtist, CompactAlbum,
+                                    CompactTrack]]] = {
+    'artist': CompactArtist,
+    'collection': CompactAlbum,
+    'audiobook': CompactAlbum,
+    'track': CompactTrack
+}
+
+
+def compact_entity(
+    data: iTunesResult,
+    keep_raw: bool = False,
+    idmap: Optional[IdentityMap] = None
+) -> Union[CompactArtist, CompactAlbum, CompactTrack]:
+    """Builds the compact entity for raw data from iTunes.
+
+    Arguments:
+        data {iTunesResult} -- The raw data returned by iTunes.
+
+    Keyword Arguments:
+        keep_raw {bool} -- Whether or not to keep the raw data. (default: {False})
+        idmap {Optional[IdentityMap]} -- The entities to share parents with. (default: {None})
+
+    Returns:
+        Union[CompactArtist, CompactAlbum, CompactTrack] -- The entity, other wrapper types built as the kind their ids describe.
+    """
+    # The compact class of the wrapper type.
+    kind: Type[Union[CompactArtist, CompactAlbum, CompactTrack]] = \
+        COMPACT_TYPES.get(data['wrapperType']) or \
+        COMPACT_TYPES[result_kind(data)]
+    return kind.from_result(data, keep_raw, idmap)
@@ -2,9 +2,11 @@
 """
 Author   : Evan Elias Young
 Date     : 2020-03-14
-Revision : 2020-03-14
+Revision : 2026-10-18
 """
 
+from typing import Tuple
+
 AUTHOR: str = 'Evan Elias Young'
 DATE: str = '2020-03-14'
 REVISION: str = '2020-03-14'
@@ -26,6 +28,8 @@ SPACES: str = ' ' * SPACES_NUM
 DOTS: str = f'{"." * SPACES_NUM}{SPACES}'
 # The number of characters in each line.
 LINE_LENGTH: int = 4 + MAX_ID_LEN + MAX_NAME_LEN + MAX_ARTIST_LEN + SPACES_NUM * 5
+# The max bytes read for one key press, enough for any escape sequence.
+KEY_READ_SIZE: int = 32
 assert LINE_LENGTH <= 79, f'line length too large, {LINE_LENGTH}'
 # The default for the country option.
 SEARCH_COUNTRY: str = 'US'
@@ -33,7 +37,80 @@ SEARCH_COUNTRY: str = 'US'
 SEARCH_MEDIA: str = 'music'
 # The default for the entity option.
 SEARCH_LIMIT: int = 10
+# The max number of results iTunes returns for one search request.
+SEARCH_PAGE_SIZE: int = 200
 # The default for the lang option.
 SEARCH_LANG: str = 'en_us'
+# Whether or not to request JSONP instead of plain json.
+SEARCH_JSONP: bool = False
+# Whether or not release dates are parsed on first access.
+LAZY_DATES: bool = False
+# The max number of parsed release dates kept.
+DATE_CACHE_SIZE: int = 4096
 # Whether or not the program is censored.
 CENSORED: bool = False
+# The base url of the iTunes store.
+ITUNES_URL: str = 'https://itunes.apple.com'
+# The number of pooled connections kept alive per host.
+POOL_SIZE: int = 10
+# The seconds to wait for a connection to be established.
+CONNECT_TIMEOUT: float = 3.05
+# The seconds to wait for the server to send data.
+READ_TIMEOUT: float = 10
+# The max number of requests an async client sends at once.
+ASYNC_CONCURRENCY: int = 10
+# The number of times a failed request is retried.
+RETRIES: int = 3
+# The backoff factor between retries, in seconds.
+RETRY_BACKOFF: float = 0.5
+# The max requests per second iTunes allows from one address.
+RATE_LIMIT: float = 20 / 60
+# The max requests sent in a burst.
+RATE_BURST: float = 5
+# The status codes iTunes uses when throttling.
+THROTTLE_STATUSES: Tuple[int, ...] = (403, 429)
+# The seconds to pause after a throttle without a Retry-After header.
+THROTTLE_BACKOFF: float = 5
+# The max seconds to pause after repeated throttles.
+THROTTLE_MAX_BACKOFF: float = 5 * 60
+# The default seconds a cached response lives.
+CACHE_TTL: float = 60 * 60
+# The default max number of cached responses.
+CACHE_SIZE: int = 1024
+# The default path of the on-disk response cache.
+CACHE_PATH: str = 'itules.cache.sqlite'
+# The max number of ids packed into a lookup of related entities.
+RELATED_CHUNK_SIZE: int = 10
+# The default path of the local search index.
+INDEX_PATH: str = 'itules.index.sqlite'
+# The default path of the catalog mirror.
+SYNC_PATH: str = 'itules.sync.sqlite'
+# The seconds between lookups of an entity that just changed.
+SYNC_MIN_INTERVAL: float = 24 * 60 * 60
+# The max seconds between lookups of an entity that never changes.
+SYNC_MAX_INTERVAL: float = 32 * 24 * 60 * 60
+# The max number of storefronts searched at once.
+FANOUT_WORKERS: int = 8
+# The max number of ids packed into a single lookup request.
+LOOKUP_CHUNK_SIZE: int = 100
+# The numbers of results the benchmark suite measures.
+BENCH_SIZES: Tuple[int, ...] = (10, 200, 10000)
+# The upper bounds, in seconds, of the latency histogram buckets.
+METRIC_BUCKETS: Tuple[float, ...] = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+                                     0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+# The prefix of every exported metric name.
+METRIC_PREFIX: str = 'itules_'
+# The escape codes clearing the screen and scrollback, cursor at home.
+CLEAR_SCREEN: str = '\033[H\033[2J\033[3J'
+# The seconds typing must pause before a typeahead request is sent.
+TYPEAHEAD_DELAY: float = 0.15
+# The max number of typeahead results per request.
+TYPEAHEAD_LIMIT: int = 10
+# The max number of typeahead terms kept in the prefix cache.
+TYPEAHEAD_CACHE_SIZE: int = 256
+# The max bytes read from the socket at once when streaming a response.
+STREAM_CHUNK_SIZE: int = 16 * 1024
+# The bytes of dump each ingestion task reads.
+INGEST_PART_SIZE: int = 16 * 1024 * 1024
+# The max number of responses kept by an entity memo.
+ENTITY_MEMO_SIZE: int = 256
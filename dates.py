@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Author   : Evan Elias Young
+Date     : 2026-10-18
+Revision : 2026-10-18
+"""
+
+from constants import *
+from typing import Optional
+from functools import lru_cache
+from datetime import datetime as dt
+import calendar
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def parse_date(text: str) -> dt:
+    """Parses a date in the fixed %Y-%m-%dT%H:%M:%SZ format iTunes uses.
+
+    Arguments:
+        text {str} -- The date sent by iTunes.
+
+    Raises:
+        ValueError: The date is not in the iTunes format.
+
+    Returns:
+        dt -- The date.
+    """
+    if len(text) != 20 or text[19] != 'Z':
+        return dt.strptime(text, '%Y-%m-%dT%H:%M:%SZ')
+    return dt(int(text[0:4]), int(text[5:7]), int(text[8:10]),
+              int(text[11:13]), int(text[14:16]), int(text[17:19]))
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def parse_timestamp(text: str) -> int:
+    """Parses a date sent by iTunes into seconds since the epoch.
+
+    Arguments:
+        text {str} -- The date sent by iTunes, in UTC.
+
+    Returns:
+        int -- The seconds since the epoch.
+    """
+    return calendar.timegm(parse_date(text).timetuple())
+
+
+class Dated:
+    """Represents an entity with a release date, parsed eagerly or lazily.
+    """
+    __slots__ = ()
+    # The release date, as sent by iTunes.
+    release: str
+    # The parsed release date, None until parsed.
+    _date: Optional[dt]
+
+    def set_release(self, text: str) -> None:
+        """Sets the release date, parsing it now unless LAZY_DATES is set.
+
+        Arguments:
+            text {str} -- The date sent by iTunes.
+        """
+        self.release = text
+        self._date = None if LAZY_DATES else parse_date(text)
+
+    @property
+    def date(self) -> dt:
+        """The release date.
+        """
+        if self._date is None:
+            self._date = parse_date(self.release)
+        return self._date
+
+    @date.setter
+    def date(self, value: dt) -> None:
+        self._date = value
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Author   : Evan Elias Young
+Date     : 2026-10-18
+Revision : 2026-10-18
+"""
+
+from constants import *
+from typing import Optional, Union, List, Dict, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from client import iTunesClient
+from album import Album
+from artist import Artist
+from track import Track
+from identity import IdentityMap
+from index import ENTITY_WRAPPERS, entity_wrappers
+from wrapper import lookup_related, chunk_ids, build_entity
+
+# The attribute holding the related entities of each related wrapper type.
+RELATED_ATTRS: Dict[str, str] = {'collection': 'albums', 'track': 'tracks'}
+
+
+def expand(ids: Iterable[int],
+           entity: str,
+           limit: Optional[int] = None,
+           client: Optional[iTunesClient] = None,
+           workers: int = FANOUT_WORKERS) -> Dict[int, Union[Artist, Album]]:
+    """Expands many artists into their albums, or albums into their tracks.
+
+    Related entities are linked to their parent, so an expanded artist holds
+    its albums in .albums and an expanded album holds its tracks in .tracks,
+    and each of those points back to the same parent object.
+
+    Arguments:
+        ids {Iterable[int]} -- The artist or album ids.
+        entity {str} -- The related entity type, album for artists or song for albums.
+
+    Keyword Arguments:
+        limit {Optional[int]} -- The max number of related results per id. (default: {None})
+        client {Optional[iTunesClient]} -- The client to send the requests with. (default: {None})
+        workers {int} -- The max number of requests sent at once. (default: {FANOUT_WORKERS})
+
+    Raises:
+        ValueError: The entity type is not one a parent can be expanded into.
+
+    Returns:
+        Dict[int, Union[Artist, Album]] -- The expanded parents by id, ids iTunes did not return are left out.
+    """
+    if any(
+            ENTITY_WRAPPERS.get(e) not in RELATED_ATTRS
+            for e in entity.split(',')):
+        raise ValueError(f'cannot expand into {entity!r}, '
+                         'expected album or song')
+    # The entities shared between every parent and related result.
+    idmap: IdentityMap = IdentityMap()
+    # The expanded parents by id.
+    expanded: Dict[int, Union[Artist, Album]] = {}
+
+    # The attributes holding the related entities.
+    attrs: List[str] = [RELATED_ATTRS[w] for w in entity_wrappers(entity)]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for found in executor.map(
+                lambda chunk: lookup_related(chunk, entity, limit, client),
+                chunk_ids(ids, RELATED_CHUNK_SIZE)):
+            for uid, (raw_parent, related) in found.items():
+                if raw_parent is None:
+                    continue
+                # The parent entity, registered before its related entities.
+                parent: Union[Artist, Album] = build_entity(raw_parent, idmap)
+                for attr in attrs:
+                    setattr(parent, attr, [])
+                for raw_ent in related:
+                    # The attribute holding entities of this type, if any.
+                    attr: Optional[str] = RELATED_ATTRS.get(
+                        raw_ent['wrapperType'])
+                    if attr is not None:
+                        getattr(parent, attr).append(
+                            build_entity(raw_ent, idmap))
+                expanded[uid] = parent
+    return expanded
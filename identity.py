@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Author   : Evan Elias Young
+Date     : 2026-10-18
+Revision : 2026-10-18
+"""
+
+from constants import *
+from typing import Optional, List, Dict, Tuple, Any, TypeVar
+from collections import OrderedDict
+import threading
+
+T = TypeVar('T')
+
+
+class IdentityMap:
+    """Represents the entities already built, so each id maps to one object.
+    """
+    # The entities by type name and id.
+    entities: Dict[Tuple[str, int], Any]
+    # The number of entities reused.
+    hits: int
+    # The number of entities built.
+    misses: int
+
+    def __init__(self) -> None:
+        self.entities = {}
+        self.hits = 0
+        self.misses = 0
+
+    def find(self, kind: str, uid: int) -> Any:
+        """Finds an entity that was already built.
+
+        Arguments:
+            kind {str} -- The entity type name.
+            uid {int} -- The entity id.
+
+        Returns:
+            Any -- The shared entity, None if not built yet.
+        """
+        # The known entity, if any.
+        entity: Any = self.entities.get((kind, uid))
+        if entity is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entity
+
+    def put(self, kind: str, uid: int, entity: T) -> T:
+        """Stores an entity, replacing any known one with the same id.
+
+        Arguments:
+            kind {str} -- The entity type name.
+            uid {int} -- The entity id.
+            entity {T} -- The entity.
+
+        Returns:
+            T -- The entity.
+        """
+        self.entities[(kind, uid)] = entity
+        return entity
+
+    def clear(self) -> None:
+        """Forgets every entity.
+        """
+        self.entities.clear()
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+
+# The body, identity map and entities of a memoized response.
+MemoEntry = Tuple[bytes, Optional[IdentityMap], List[Any]]
+
+
+class EntityMemo:
+    """Represents a bounded memo of the entities built from each response.
+
+    Entries are keyed by the cache key of the request and checked against
+    the response body, so a response served again costs a dict lookup and a
+    bytes comparison instead of a decode and a build. The entities are
+    shared between hits, and must not be modified.
+    """
+    # The responses by cache key, least recently used first.
+    entries: 'OrderedDict[str, MemoEntry]'
+    # The max number of responses kept.
+    size: int
+    # The lock guarding the entries.
+    lock: threading.Lock
+    # The number of responses reused.
+    hits: int
+    # The number of responses built.
+    misses: int
+
+    def __init__(self, size: int = ENTITY_MEMO_SIZE) -> None:
+        self.entries = OrderedDict()
+        self.size = size
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str, body: bytes,
+            idmap: Optional[IdentityMap]) -> Optional[List[Any]]:
+        """Gets the entities built from a response.
+
+        Arguments:
+            key {str} -- The cache key of the request.
+            body {bytes} -- The response body.
+            idmap {Optional[IdentityMap]} -- The identity map shared across responses, if any.
+
+        Returns:
+            Optional[List[Any]] -- A new list of the entities, None if the body or identity map changed.
+        """
+        with self.lock:
+            # The entry of the request, if any.
+            entry: Optional[MemoEntry] = self.entries.get(key)
+            if entry is None or entry[1] is not idmap or \
+                    (entry[0] is not body and entry[0] != body):
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return list(entry[2])
+
+    def put(self, key: str, body: bytes, idmap: Optional[IdentityMap],
+            entities: List[Any]) -> None:
+        """Stores the entities built from a response, evicting the oldest.
+
+        Arguments:
+            key {str} -- The cache key of the request.
+            body {bytes} -- The response body.
+            idmap {Optional[IdentityMap]} -- The identity map shared across responses, if any.
+            entities {List[Any]} -- The entities.
+        """
+        with self.lock:
+            self.entries[key] = (body, idmap, list(entities))
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Forgets every response.
+        """
+        with self.lock:
+            self.entries.clear()
+
+    def __len__(self) -> int:
+        return len(self.entries)
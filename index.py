@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Author   : Evan Elias Young
+Date     : 2026-10-18
+Revision : 2026-10-18
+"""
+
+from constants import *
+from typing import Optional, List, Dict, Iterable, Any
+import json
+import sqlite3
+import threading
+from results import iTunesResult, result_id
+
+# The wrapper types returned for each search entity.
+ENTITY_WRAPPERS: Dict[str, str] = {
+    'song': 'track',
+    'musicTrack': 'track',
+    'musicVideo': 'track',
+    'album': 'collection',
+    'musicArtist': 'artist',
+    'allArtist': 'artist',
+    'audiobook': 'audiobook'
+}
+
+
+def entity_wrappers(entity: str) -> List[str]:
+    """Gets the wrapper types a search entity returns.
+
+    Arguments:
+        entity {str} -- The entity type(s).
+
+    Returns:
+        List[str] -- The wrapper types.
+    """
+    return list(
+        dict.fromkeys(ENTITY_WRAPPERS[e] for e in entity.split(',')
+                      if e in ENTITY_WRAPPERS))
+
+
+def match_query(term: str) -> str:
+    """Builds a full-text query matching every word of a term as a prefix.
+
+    Arguments:
+        term {str} -- The search term.
+
+    Returns:
+        str -- The full-text query.
+    """
+    return ' '.join('"' + word.replace('"', '""') + '"*'
+                    for word in term.split())
+
+
+class LocalIndex:
+    """Represents an offline, ranked full-text index of harvested results.
+    """
+    # The path to the database file.
+    path: str
+    # The connection to the database file.
+    conn: sqlite3.Connection
+    # The lock guarding the connection.
+    lock: threading.Lock
+
+    def __init__(self, path: str = INDEX_PATH) -> None:
+        self.path = path
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.lock = threading.Lock()
+        self.conn.execute('CREATE TABLE IF NOT EXISTS entities ('
+                          'id INTEGER PRIMARY KEY, kind TEXT NOT NULL, '
+                          'uid INTEGER NOT NULL, raw TEXT NOT NULL, '
+                          'UNIQUE (kind, uid))')
+        self.conn.execute('CREATE VIRTUAL TABLE IF NOT EXISTS names USING '
+                          'fts5(track, album, artist)')
+        self.conn.commit()
+
+    def add(self, results: Iterable[iTunesResult]) -> int:
+        """Stores raw results, replacing any stored with the same id.
+
+        Arguments:
+            results {Iterable[iTunesResult]} -- The raw data returned by iTunes.
+
+        Returns:
+            int -- The number of results stored.
+        """
+        # The number of results stored.
+        count: int = 0
+        with self.lock:
+            for raw in results:
+                # The wrapper type of the result.
+                kind: str = raw['wrapperType']
+                # The row of the result.
+                row: int = self.conn.execute(
+                    'INSERT INTO entities (kind, uid, raw) VALUES (?, ?, ?) '
+                    'ON CONFLICT (kind, uid) DO UPDATE SET raw = excluded.raw '
+                    'RETURNING id',
+                    (kind, result_id(raw), json.dumps(raw))).fetchone()[0]
+                self.conn.execute(
+                    'INSERT OR REPLACE INTO names '
+                    '(rowid, track, album, artist) VALUES (?, ?, ?, ?)',
+                    (row, raw.get('trackName'), raw.get('collectionName'),
+                     raw.get('artistName')))
+                count += 1
+            self.conn.commit()
+        return count
+
+    def add_entities(self, entities: Iterable[Any]) -> int:
+        """Stores the raw data of entities, skipping those without any.
+
+        Arguments:
+            entities {Iterable[Any]} -- The entities.
+
+        Returns:
+            int -- The number of results stored.
+        """
+        return self.add(e.raw for e in entities
+                        if e is not None and getattr(e, 'raw', None))
+
+    def search(self,
+               term: str,
+               wrapper_types: Optional[List[str]] = None,
+               limit: int = SEARCH_LIMIT) -> List[iTunesResult]:
+        """Searches the stored results by track, album and artist name.
+
+        Arguments:
+            term {str} -- The search term, each word matched as a prefix.
+
+        Keyword Arguments:
+            wrapper_types {Optional[List[str]]} -- The wrapper types to keep, None for all. (default: {None})
+            limit {int} -- The max number of results. (default: {SEARCH_LIMIT})
+
+        Returns:
+            List[iTunesResult] -- The best matching results first.
+        """
+        # The full-text query.
+        query: str = match_query(term)
+        if not query:
+            return []
+        # The filter on wrapper types.
+        kinds: str = ''
+        if wrapper_types:
+            kinds = 'AND entities.kind IN ({}) '.format(','.join(
+                '?' * len(wrapper_types)))
+        with self.lock:
+            return [
+                json.loads(raw) for raw, in self.conn.execute(
+                    'SELECT entities.raw FROM names JOIN entities ON '
+                    'entities.id = names.rowid WHERE names MATCH ? ' + kinds +
+                    'ORDER BY names.rank LIMIT ?', (query, *(
+                        wrapper_types or []), limit))
+            ]
+
+    def close(self) -> None:
+        """Closes the database file.
+        """
+        self.conn.close()
+
+    def __len__(self) -> int:
+        with self.lock:
+            return self.conn.execute(
+                'SELECT COUNT(*) FROM entities').fetchone()[0]
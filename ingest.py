@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Author   : Evan Elias Young
+Date     : 2026-10-18
+Revision : 2026-10-18
+"""
+
+from constants import *
+from typing import Optional, List, Dict, Tuple, Iterable, Iterator, Any
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import json
+import mmap
+import os
+import shutil
+import sys
+import time
+from codec import loads
+from results import iTunesResult, result_id
+from identity import IdentityMap
+from compact import compact_entity
+from columnar import write_parquet
+from records import entity_record
+
+
+def split_lines(path: str,
+                part_size: int = INGEST_PART_SIZE) -> List[Tuple[int, int]]:
+    """Splits a file into byte ranges of whole lines.
+
+    Arguments:
+        path {str} -- The path of the file.
+
+    Keyword Arguments:
+        part_size {int} -- The bytes per range, before rounding up to the end of a line. (default: {INGEST_PART_SIZE})
+
+    Returns:
+        List[Tuple[int, int]] -- The start and end of each range.
+    """
+    # The size of the file.
+    size: int = os.path.getsize(path)
+    # The ranges of the file.
+    ranges: List[Tuple[int, int]] = []
+    if not size:
+        return ranges
+    with open(path, 'rb') as file, \
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as view:
+        # The start of the current range.
+        start: int = 0
+        while start < size:
+            # The end of the current range.
+            end: int = start + part_size
+            if end < size:
+                end = view.find(b'\n', end - 1) + 1 or size
+            else:
+                end = size
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def iter_lines(path: str, start: int, end: int) -> Iterator[bytes]:
+    """Reads the lines in a byte range of a file, through a memory map.
+
+    Arguments:
+        path {str} -- The path of the file.
+        start {int} -- The start of the range, at the start of a line.
+        end {int} -- The end of the range, at the end of a line.
+
+    Returns:
+        Iterator[bytes] -- The lines, without their line breaks.
+    """
+    with open(path, 'rb') as file, \
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as view:
+        while start < end:
+            # The end of the current line.
+            stop: int = view.find(b'\n', start, end)
+            if stop < 0:
+                stop = end
+            yield view[start:stop]
+            start = stop + 1
+
+
+def iter_dump_results(lines: Iterable[bytes],
+                      counts: Dict[str, int]) -> Iterator[iTunesResult]:
+    """Decodes the results of dumped lines, each a response or one result.
+
+    Lines that do not decode, and results that are not objects, are counted
+    as errors and skipped.
+
+    Arguments:
+        lines {Iterable[bytes]} -- The dumped lines.
+        counts {Dict[str, int]} -- The counters to add the lines and errors to.
+
+    Returns:
+        Iterator[iTunesResult] -- The raw data returned by iTunes.
+    """
+    for line in lines:
+        if not line.strip():
+            continue
+        counts['lines'] += 1
+        try:
+            # The response or result on the line.
+            data: Any = loads(line)
+        except ValueError:
+            counts['errors'] += 1
+            continue
+        if not isinstance(data, dict):
+            counts['errors'] += 1
+            continue
+        # The results on the line.
+        results: List[Any] = data['results'] if isinstance(
+            data.get('results'), list) else [data]
+        for raw in results:
+            if isinstance(raw, dict):
+                yield raw
+            else:
+                counts['errors'] += 1
+
+
+def iter_identified(results: Iterable[iTunesResult],
+                    counts: Dict[str, int]) -> Iterator[iTunesResult]:
+    """Skips the results that lack the id of their kind of entity.
+
+    Results without an id are counted as errors, as building them would
+    fail, so columns count the same errors as compact records.
+
+    Arguments:
+        results {Iterable[iTunesResult]} -- The raw data returned by iTunes.
+        counts {Dict[str, int]} -- The counters to add the errors to.
+
+    Returns:
+        Iterator[iTunesResult] -- The results with an id.
+    """
+    for raw in results:
+        try:
+            result_id(raw)
+        except KeyError:
+            counts['errors'] += 1
+            continue
+        yield raw
+
+
+def ingest_part(path: str,
+                start: int,
+                end: int,
+                output: str,
+                output_format: str = 'ndjson',
+                wrapper_type: str = 'track') -> Dict[str, int]:
+    """Builds the entities of a byte range of a dump, writing them to a file.
+
+    Runs in a worker process, so only the counters travel back.
+
+    Arguments:
+        path {str} -- The path of the dump.
+        start {int} -- The start of the range, at the start of a line.
+        end {int} -- The end of the range, at the end of a line.
+        output {str} -- The path of the output file.
+
+    Keyword Arguments:
+        output_format {str} -- Either ndjson for compact records, or parquet for columns of one wrapper type. (default: {'ndjson'})
+        wrapper_type {str} -- The wrapper type written to parquet. (default: {'track'})
+
+    Returns:
+        Dict[str, int] -- The lines, entities and errors.
+    """
+    # The counters of the range.
+    counts: Dict[str, int] = {'lines': 0, 'entities': 0, 'errors': 0}
+    # The results of the range.
+    results: Iterator[iTunesResult] = iter_dump_results(
+        iter_lines(path, start, end), counts)
+    if output_format == 'parquet':
+        counts['entities'] = write_parquet(iter_identified(results, counts),
+                                           output, wrapper_type)
+        return counts
+    # The entities shared between the results of the range.
+    idmap: IdentityMap = IdentityMap()
+    with open(output, 'w', encoding='utf-8') as out:
+        for raw in results:
+            try:
+                out.write(
+                    json.dumps(entity_record(compact_entity(raw, idmap=idmap)))
+                    + '\n')
+            except (KeyError, TypeError, ValueError):
+                counts['errors'] += 1
+                continue
+            counts['entities'] += 1
+    return counts
+
+
+def ingest(paths: Iterable[str],
+           output: str,
+           output_format: str = 'ndjson',
+           wrapper_type: str = 'track',
+           workers: Optional[int] = None,
+           part_size: int = INGEST_PART_SIZE) -> Dict[str, int]:
+    """Builds the entities of NDJSON dumps in a process pool.
+
+    Each dump is split into ranges of whole lines, and each range is built
+    and written by a worker. Compact records are joined into a single NDJSON
+    file in dump order, parquet parts are left as a dataset directory.
+
+    Arguments:
+        paths {Iterable[str]} -- The paths of the dumps.
+        output {str} -- The NDJSON file, or the parquet directory.
+
+    Keyword Arguments:
+        output_format {str} -- Either ndjson for compact records, or parquet for columns of one wrapper type. (default: {'ndjson'})
+        wrapper_type {str} -- The wrapper type written to parquet. (default: {'track'})
+        workers {Optional[int]} -- The number of processes, None for one per core. (default: {None})
+        part_size {int} -- The bytes of dump per task. (default: {INGEST_PART_SIZE})
+
+    Returns:
+        Dict[str, int] -- The lines, entities and errors.
+    """
+    # The byte ranges of every dump.
+    tasks: List[Tuple[str, int, int]] = [(path, start, end)
+                                         for path in paths
+                                         for start, end in split_lines(
+                                             path, part_size)]
+    # The output file of each task.
+    parts: List[str]
+    if output_format == 'parquet':
+        os.makedirs(output, exist_ok=True)
+        parts = [
+            os.path.join(output, f'part-{i:05}.parquet')
+            for i in range(len(tasks))
+        ]
+    else:
+        parts = [f'{output}.part-{i:05}' for i in range(len(tasks))]
+    # The counters of every range.
+    totals: Dict[str, int] = {'lines': 0, 'entities': 0, 'errors': 0}
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for counts in executor.map(ingest_part, *zip(*tasks), parts,
+                                   [output_format] * len(tasks),
+                                   [wrapper_type] * len(tasks)):
+            for key, value in counts.items():
+                totals[key] += value
+    if output_format != 'parquet':
+        with open(output, 'wb') as out:
+            for part in parts:
+                with open(part, 'rb') as source:
+                    shutil.copyfileobj(source, out)
+                os.remove(part)
+    return totals
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Builds the entities of NDJSON dumps from the command line.
+
+    Keyword Arguments:
+        argv {Optional[List[str]]} -- The command line arguments. (default: {None})
+
+    Returns:
+        int -- The exit status.
+    """
+    # The command line parser.
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog='ingest', description='Builds the entities of NDJSON dumps.')
+    parser.add_argument('output',
+                        help='the NDJSON file, or the parquet directory')
+    parser.add_argument('dumps', nargs='+', help='the NDJSON dumps')
+    parser.add_argument('-f',
+                        '--format',
+                        choices=['ndjson', 'parquet'],
+                        default='ndjson',
+                        help='compact records, or columns of one type')
+    parser.add_argument('-t',
+                        '--type',
+                        default='track',
+                        help='the wrapper type written to parquet')
+    parser.add_argument('-w',
+                        '--workers',
+                        type=int,
+                        default=None,
+                        help='the number of processes (default: cores)')
+    args: argparse.Namespace = parser.parse_args(argv)
+
+    # The time the run started.
+    start: float = time.perf_counter()
+    # The counters of the run.
+    totals: Dict[str, int] = ingest(args.dumps, args.output, args.format,
+                                    args.type, args.workers)
+    # The seconds the run took.
+    total: float = time.perf_counter() - start
+    # The bytes of dump read.
+    size: int = sum(os.path.getsize(path) for path in args.dumps)
+    print(f'{totals["lines"]} lines, {totals["entities"]} entities, '
+          f'{totals["errors"]} errors in {total:.2f}s '
+          f'({size / total / 2**20:.1f} MiB/s, '
+          f'{totals["entities"] / total:.0f} entities/s)',
+          file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Author   : Evan Elias Young
+Date     : 2026-10-18
+Revision : 2026-10-18
+"""
+
+from typing import Optional, Union, List, Dict, Callable, Iterator, Any
+from collections.abc import Sequence
+from results import iTunesResponse, iTunesResult
+from identity import IdentityMap
+
+
+class LazyResults(Sequence):
+    """Represents the entities of a response, each built on first access.
+    """
+    # The raw results of the response.
+    results: List[iTunesResult]
+    # The positions in the raw results this view covers, None for all.
+    indices: Optional[List[int]]
+    # The entities built so far by position, shared with filtered views.
+    built: Dict[int, Any]
+    # The function building an entity.
+    build: Callable[[iTunesResult, Optional[IdentityMap]], Any]
+    # The entities shared between the results.
+    idmap: IdentityMap
+
+    def __init__(self,
+                 response: iTunesResponse,
+                 build: Callable[[iTunesResult, Optional[IdentityMap]], Any],
+                 idmap: Optional[IdentityMap] = None) -> None:
+        """Wraps a response without building any entity.
+
+        Arguments:
+            response {iTunesResponse} -- The raw data returned by iTunes.
+            build {Callable[[iTunesResult, Optional[IdentityMap]], Any]} -- The function building an entity.
+
+        Keyword Arguments:
+            idmap {Optional[IdentityMap]} -- The entities to share parents with. (default: {None})
+        """
+        self.results = response['results']
+        self.indices = None
+        self.built = {}
+        self.build = build
+        self.idmap = idmap if idmap is not None else IdentityMap()
+
+    def _entity(self, pos: int) -> Any:
+        """Gets the entity at a position in the raw results, building it once.
+
+        Arguments:
+            pos {int} -- The position in the raw results.
+
+        Returns:
+            Any -- The entity.
+        """
+        # The entity, if already built.
+        entity: Any = self.built.get(pos)
+        if entity is None:
+            entity = self.built[pos] = self.build(self.results[pos],
+                                                  self.idmap)
+        return entity
+
+    def _positions(self) -> Union[range, List[int]]:
+        """Gets the positions in the raw results this view covers.
+
+        Returns:
+            Union[range, List[int]] -- The positions.
+        """
+        return range(len(self.results)) if self.indices is None \
+            else self.indices
+
+    def of_type(self, wrapper_type: str) -> 'LazyResults':
+        """Filters the results by wrapper type, without building any entity.
+
+        Arguments:
+            wrapper_type {str} -- The wrapper type, such as track or collection.
+
+        Returns:
+            LazyResults -- The view of the matching results.
+        """
+        # The filtered view, sharing the built entities.
+        view: LazyResults = LazyResults.__new__(LazyResults)
+        view.results = self.results
+        view.built = self.built
+        view.build = self.build
+        view.idmap = self.idmap
+        view.indices = [
+            pos for pos in self._positions()
+            if self.results[pos]['wrapperType'] == wrapper_type
+        ]
+        return view
+
+    def raw(self, index: int) -> iTunesResult:
+        """Gets the raw data of a result, without building its entity.
+
+        Arguments:
+            index {int} -- The index in this view.
+
+        Returns:
+            iTunesResult -- The raw data returned by iTunes.
+        """
+        return self.results[self._positions()[index]]
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self._entity(pos) for pos in self._positions()[index]]
+        return self._entity(self._positions()[index])
+
+    def __iter__(self) -> Iterator[Any]:
+        for pos in self._positions():
+            yield self._entity(pos)
+
+    def __len__(self) -> int:
+        return len(self._positions())
@@ -2,10 +2,14 @@
 """
 Author   : Evan Elias Young
 Date     : 2020-03-14
-Revision : 2020-03-14
+Revision : 2026-10-18
 """
 
-from menus import main_menu
+import sys
 
 if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        from batch import main
+        sys.exit(main(sys.argv[1:]))
+    from menus import main_menu
     main_menu()
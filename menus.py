@@ -2,18 +2,31 @@
 """
 Author   : Evan Elias Young
 Date     : 2020-03-14
-Revision : 2020-03-14
+Revision : 2026-10-18
 """
 
 from constants import *
-from typing import Tuple, List, Dict, Optional, Union
+from typing import Tuple, List, Dict, Optional, Union, TYPE_CHECKING
 import sys
-from utils import clear, pause
+import threading
+from utils import clear, pause, read_key
 from utils import align_dict, print_centered
-from album import Album
-from artist import Artist
-from track import Track
-from wrapper import print_result, lookup_entity, search_entities
+
+if TYPE_CHECKING:
+    from results import iTunesResult
+    from album import Album
+    from artist import Artist
+    from track import Track
+
+
+def warm_up() -> None:
+    """Imports the network stack and opens a pooled connection.
+
+    Runs in the background while the user reads the first menu, the wrapper
+    is only imported by the menus once a search or lookup is sent.
+    """
+    from client import get_client
+    get_client().warm_up()
 
 
 def print_header() -> None:
@@ -80,6 +93,7 @@ def search_menu() -> None:
             'album': 'search for a album',
             'artist': 'search for a artist',
             'all': 'search for any of the above',
+            'live': 'search for a song as you type',
             'back': 'go back',
             'exit': 'exit the program'
         }
@@ -94,6 +108,8 @@ def search_menu() -> None:
             sys.exit(0)
         elif choice == 'back':
             keep_alive = False
+        elif choice == 'live':
+            typeahead_menu('song')
         else:
             search_term: str = ' '.join(args)
             if len(args) == 0:
@@ -102,12 +118,20 @@ def search_menu() -> None:
                 search_term = input('enter your search term:\n')
             entity_name: str = 'song,album,musicArtist' if choice == 'all' else \
                 'musicArtist' if choice == 'artist' else choice
-            search_results: List[Union[Artist, Album,
-                                       Track]] = search_entities(
-                                           search_term, entity_name)
+            import requests
+            from wrapper import print_result, search_entities
+            # The entities found, None if the request failed.
+            search_results: Optional[List[Union[Artist, Album, Track]]]
+            try:
+                search_results = search_entities(search_term, entity_name)
+            except requests.RequestException:
+                # Network errors and throttles past the retries.
+                search_results = None
             clear()
             print_centered(f'{choice.upper()} SEARCH RESULTS')
-            if len(search_results) > 0:
+            if search_results is None:
+                print_centered('REQUEST FAILED, TRY AGAIN LATER')
+            elif len(search_results) > 0:
                 for _, result in enumerate(search_results):
                     print_result(result)
             else:
@@ -115,6 +139,56 @@ def search_menu() -> None:
             pause()
 
 
+def typeahead_menu(entity: str) -> None:
+    """The live search menu for iTules, showing results as the user types.
+
+    Arguments:
+        entity {str} -- The entity type(s) to search for.
+    """
+    from typeahead import Typeahead
+    from wrapper import build_entity, print_result
+    # The term typed so far.
+    term: str = ''
+    # The results shown last, kept on screen until newer ones arrive.
+    last: List['iTunesResult'] = []
+    # The lock keeping redraws from the request threads apart.
+    lock: threading.Lock = threading.Lock()
+
+    def show(shown: str, results: 'List[iTunesResult]', final: bool) -> None:
+        with lock:
+            if shown != term:
+                return
+            if results or final:
+                last[:] = results
+            print_header()
+            print_centered('LIVE SEARCH')
+            print(f'search: {term}')
+            print()
+            for raw in last:
+                print_result(build_entity(raw))
+            if final and not results and term.strip():
+                print_centered('NO RESULTS')
+            elif not final:
+                print_centered('searching . . .')
+
+    # The search sent as the user types.
+    typeahead: Typeahead = Typeahead(entity, show)
+    show(term, [], True)
+    while True:
+        # The key the user pressed.
+        key: str = read_key()
+        if key in ('', '\x1b', '\r', '\n'):
+            break
+        if key in ('\x7f', '\b'):
+            term = term[:-1]
+        elif key.isprintable():
+            term += key
+        else:
+            continue
+        typeahead.update(term)
+    typeahead.close()
+
+
 def lookup_menu(uid: Optional[int]) -> None:
     """The lookup menu for iTules.
     """
@@ -142,11 +216,22 @@ def lookup_menu(uid: Optional[int]) -> None:
             keep_alive = False
         elif choice.isdigit():
             keep_alive = False
-            entity: Optional[Union[Artist, Album,
-                                   Track]] = lookup_entity(int(choice))
+            import requests
+            from wrapper import print_result, lookup_entity
+            # The entity found, if any.
+            entity: Optional[Union[Artist, Album, Track]] = None
+            # Whether or not the request failed.
+            failed: bool = False
+            try:
+                entity = lookup_entity(int(choice))
+            except requests.RequestException:
+                # Network errors and throttles past the retries.
+                failed = True
             clear()
             print_centered('LOOKUP RESULTS')
-            if entity:
+            if failed:
+                print_centered('REQUEST FAILED, TRY AGAIN LATER')
+            elif entity:
                 print_result(entity)
             else:
                 print_centered('NO RESULTS')
@@ -158,6 +243,7 @@ def main_menu() -> None:
     """
     # Whether or not to keep the menu alive.
     keep_alive: bool = True
+    threading.Thread(target=warm_up, daemon=True).start()
 
     while keep_alive:
         # The valid options the user can pick.
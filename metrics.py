@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Author   : Evan Elias Young
+Date     : 2026-10-18
+Revision : 2026-10-18
+"""
+
+from constants import *
+from typing import List, Dict, Set, Tuple, Iterator
+from contextlib import contextmanager
+import bisect
+import threading
+import time
+
+# The name and sorted labels of a series.
+SeriesKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+def series_key(name: str, labels: Dict[str, str]) -> SeriesKey:
+    """Builds the key of a series.
+
+    Arguments:
+        name {str} -- The metric name.
+        labels {Dict[str, str]} -- The labels of the series.
+
+    Returns:
+        SeriesKey -- The key of the series.
+    """
+    return name, tuple(sorted(labels.items()))
+
+
+def series_name(key: SeriesKey, suffix: str = '') -> str:
+    """Formats a series the way Prometheus does.
+
+    Arguments:
+        key {SeriesKey} -- The key of the series.
+
+    Keyword Arguments:
+        suffix {str} -- The suffix of the metric name. (default: {''})
+
+    Returns:
+        str -- The series, such as name{label="value"}.
+    """
+    # The metric name and labels.
+    name, labels = key
+    if not labels:
+        return name + suffix
+    return name + suffix + '{' + ','.join(
+        f'{k}="{v}"' for k, v in labels) + '}'
+
+
+class Metrics:
+    """Represents where instrumented code reports to, discarding everything.
+
+    Subclasses override count and observe to keep what is reported.
+    """
+
+    def count(self, name: str, value: float = 1, **labels: str) -> None:
+        """Adds to a counter.
+
+        Arguments:
+            name {str} -- The metric name, such as requests.
+
+        Keyword Arguments:
+            value {float} -- The amount to add. (default: {1})
+        """
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """Records a measurement, such as a duration in seconds.
+
+        Arguments:
+            name {str} -- The metric name, such as request_seconds.
+            value {float} -- The measurement.
+        """
+
+    @contextmanager
+    def timer(self, name: str, **labels: str) -> Iterator[None]:
+        """Observes the seconds spent in a block.
+
+        Arguments:
+            name {str} -- The metric name, such as decode_seconds.
+        """
+        # The time the block started.
+        start: float = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+
+class Histogram:
+    """Represents the distribution of a measurement over fixed buckets.
+    """
+    # The upper bounds of the buckets.
+    bounds: Tuple[float, ...]
+    # The number of measurements per bucket, the last one unbounded.
+    counts: List[int]
+    # The number of measurements.
+    count: int
+    # The sum of the measurements.
+    total: float
+    # The largest measurement.
+    max: float
+
+    def __init__(self, bounds: Tuple[float, ...] = METRIC_BUCKETS) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def observe(self, value: float) -> None:
+        """Records a measurement.
+
+        Arguments:
+            value {float} -- The measurement.
+        """
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """Estimates a quantile as the upper bound of the bucket holding it.
+
+        Arguments:
+            q {float} -- The quantile, between 0 and 1.
+
+        Returns:
+            float -- The estimate, the largest measurement past the last bound.
+        """
+        # The rank of the quantile.
+        rank: float = q * self.count
+        # The measurements in the buckets so far.
+        seen: int = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+
+class Collector(Metrics):
+    """Represents an in-process store of counters and histograms.
+    """
+    # The counters by series.
+    counters: Dict[SeriesKey, float]
+    # The histograms by series.
+    histograms: Dict[SeriesKey, Histogram]
+    # The lock guarding the series.
+    lock: threading.Lock
+
+    def __init__(self) -> None:
+        self.counters = {}
+        self.histograms = {}
+        self.lock = threading.Lock()
+
+    def count(self, name: str, value: float = 1, **labels: str) -> None:
+        # The key of the series.
+        key: SeriesKey = series_key(name, labels)
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        # The key of the series.
+        key: SeriesKey = series_key(name, labels)
+        with self.lock:
+            if key not in self.histograms:
+                self.histograms[key] = Histogram()
+            self.histograms[key].observe(value)
+
+    def summary(self) -> Dict[str, float]:
+        """Summarizes every series, with the cache hit rate of each endpoint.
+
+        Returns:
+            Dict[str, float] -- The counters, then the count, mean, p50, p95 and max of each histogram.
+        """
+        # The summary by series.
+        summary: Dict[str, float] = {}
+        with self.lock:
+            for key, value in sorted(self.counters.items()):
+                summary[series_name(key)] = value
+            for labels in sorted({
+                    key[1]
+                    for key in self.counters
+                    if key[0] in ('cache_hits', 'cache_misses')
+            }):
+                # The lookups of the endpoint answered by the cache or not.
+                hits: float = self.counters.get(('cache_hits', labels), 0)
+                misses: float = self.counters.get(('cache_misses', labels), 0)
+                summary[series_name(('cache_hit_rate', labels))] = \
+                    hits / (hits + misses)
+            for key, hist in sorted(self.histograms.items()):
+                summary[series_name(key, '_count')] = hist.count
+                summary[series_name(key, '_mean')] = \
+                    hist.total / hist.count if hist.count else 0
+                summary[series_name(key, '_p50')] = hist.quantile(0.5)
+                summary[series_name(key, '_p95')] = hist.quantile(0.95)
+                summary[series_name(key, '_max')] = hist.max
+        return summary
+
+    def prometheus(self, prefix: str = METRIC_PREFIX) -> str:
+        """Formats every series in the Prometheus text format.
+
+        Keyword Arguments:
+            prefix {str} -- The prefix of every metric name. (default: {METRIC_PREFIX})
+
+        Returns:
+            str -- The exposition text.
+        """
+        # The lines of the exposition.
+        lines: List[str] = []
+        # The metric names already typed.
+        typed: Set[str] = set()
+        with self.lock:
+            for (name, labels), value in sorted(self.counters.items()):
+                # The metric name, as exposed.
+                full: str = f'{prefix}{name}_total'
+                if full not in typed:
+                    typed.add(full)
+                    lines.append(f'# TYPE {full} counter')
+                lines.append(f'{series_name((full, labels))} {value}')
+            for (name, labels), hist in sorted(self.histograms.items()):
+                full = prefix + name
+                if full not in typed:
+                    typed.add(full)
+                    lines.append(f'# TYPE {full} histogram')
+                # The measurements up to the current bucket.
+                seen: int = 0
+                for bound, count in zip(hist.bounds + (float('inf'), ),
+                                        hist.counts):
+                    seen += count
+                    # The upper bound, as exposed.
+                    le: str = '+Inf' if bound == float('inf') else f'{bound:g}'
+                    lines.append(
+                        series_name((full + '_bucket', labels +
+                                     (('le', le), ))) + f' {seen}')
+                lines.append(
+                    f'{series_name((full + "_sum", labels))} {hist.total}')
+                lines.append(
+                    f'{series_name((full + "_count", labels))} {hist.count}')
+        return '\n'.join(lines) + '\n'
+
+    def clear(self) -> None:
+        """Drops every series.
+        """
+        with self.lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+
+# The metrics used when no other metrics are given, discarding everything.
+NULL_METRICS: Metrics = Metrics()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Author   : Evan Elias Young
+Date     : 2026-10-18
+Revision : 2026-10-18
+"""
+
+from constants import *
+from typing import Optional, Dict
+from datetime import datetime as dt, timezone
+from email.utils import parsedate_to_datetime
+import threading
+import time
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parses a Retry-After header.
+
+    Arguments:
+        value {Optional[str]} -- The header value, in seconds or as an HTTP date.
+
+    Returns:
+        Optional[float] -- The seconds to wait, None if missing or invalid.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) -
+                         dt.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """Represents a thread-safe token bucket that slows down when throttled.
+    """
+    # The max tokens added per second.
+    max_rate: float
+    # The tokens currently added per second.
+    rate: float
+    # The max tokens the bucket holds.
+    capacity: float
+    # The tokens currently in the bucket, negative when reserved ahead.
+    tokens: float
+    # The time the bucket was last refilled.
+    updated: float
+    # The time no request may be sent before.
+    paused_until: float
+    # The number of throttle responses in a row.
+    streak: int
+    # The number of tokens handed out.
+    requests: int
+    # The number of throttle responses seen.
+    throttles: int
+    # The total seconds callers were told to wait.
+    waited: float
+    # The lock guarding the bucket.
+    lock: threading.Lock
+
+    def __init__(self,
+                 rate: float = RATE_LIMIT,
+                 capacity: float = RATE_BURST) -> None:
+        """Creates a full bucket.
+
+        Keyword Arguments:
+            rate {float} -- The max requests per second. (default: {RATE_LIMIT})
+            capacity {float} -- The max requests sent in a burst. (default: {RATE_BURST})
+        """
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.streak = 0
+        self.requests = 0
+        self.throttles = 0
+        self.waited = 0.0
+        self.lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Takes a token, without blocking, for sync and async callers alike.
+
+        Returns:
+            float -- The seconds to wait before sending the request.
+        """
+        with self.lock:
+            # The current time.
+            now: float = time.monotonic()
+            self.tokens = min(self.capacity,
+                              self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            self.requests += 1
+            # The seconds until the token is available.
+            wait: float = max(-self.tokens / self.rate,
+                              self.paused_until - now, 0.0)
+            self.waited += wait
+            return wait
+
+    def delay(self) -> float:
+        """Gets the seconds until a token is available, without taking it.
+
+        Returns:
+            float -- The seconds to wait, 0 if a token is available now.
+        """
+        with self.lock:
+            # The current time.
+            now: float = time.monotonic()
+            # The tokens in the bucket now.
+            tokens: float = min(self.capacity,
+                                self.tokens + (now - self.updated) * self.rate)
+            return max((1 - tokens) / self.rate, self.paused_until - now, 0.0)
+
+    def acquire(self) -> None:
+        """Takes a token, sleeping until it is available.
+        """
+        time.sleep(self.reserve())
+
+    def throttled(self, retry_after: Optional[float] = None) -> float:
+        """Slows down after a throttle response.
+
+        Keyword Arguments:
+            retry_after {Optional[float]} -- The seconds iTunes asked to wait. (default: {None})
+
+        Returns:
+            float -- The seconds no request will be sent for.
+        """
+        with self.lock:
+            # The seconds to pause every caller for.
+            pause: float = retry_after if retry_after is not None else min(
+                THROTTLE_BACKOFF * 2**self.streak, THROTTLE_MAX_BACKOFF)
+            self.streak += 1
+            self.throttles += 1
+            self.rate = max(self.rate / 2, self.max_rate / 16)
+            self.tokens = min(self.tokens, 0.0)
+            self.paused_until = max(self.paused_until,
+                                    time.monotonic() + pause)
+            return pause
+
+    def succeeded(self) -> None:
+        """Speeds back up after a successful response.
+        """
+        with self.lock:
+            self.streak = 0
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 16)
+
+    def stats(self) -> Dict[str, float]:
+        """Gets the limiter counters.
+
+        Returns:
+            Dict[str, float] -- The requests, throttles, seconds waited and current rate.
+        """
+        return {
+            'requests': self.requests,
+            'throttles': self.throttles,
+            'waited': self.waited,
+            'rate': self.rate
+        }
+
+
+# The limiter shared by every client unless another is given.
+DEFAULT_LIMITER: RateLimiter = RateLimiter()
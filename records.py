@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Author   : Evan Elias Young
+Date     : 2026-10-18
+Revision : 2026-10-18
+"""
+
+from constants import *
+from typing import Union, Dict, Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Only the type names are needed, so importing this module stays cheap.
+    from album import Album
+    from artist import Artist
+    from track import Track
+
+
+def entity_record(entity: Union['Artist', 'Album', 'Track'],
+                  raw: bool = False) -> Dict[str, Any]:
+    """Turns an entity into a json-ready record.
+
+    Arguments:
+        entity {Union[Artist, Album, Track]} -- The entity, full or compact.
+
+    Keyword Arguments:
+        raw {bool} -- Whether or not to include the raw data. (default: {False})
+
+    Returns:
+        Dict[str, Any] -- The record.
+    """
+    # The record of the entity.
+    record: Dict[str, Any] = {
+        'type': entity.type,
+        'id': entity.uid,
+        'name': entity.name,
+        'genre': entity.genre
+    }
+    if entity.type != 'Artist':
+        record['artistId'] = entity.artist.uid
+        record['artist'] = entity.artist.name
+        record['country'] = entity.country
+        record['date'] = entity.date.isoformat()
+    if entity.type == 'Track':
+        record['albumId'] = entity.album.uid
+        record['album'] = entity.album.name
+        record['time'] = entity.time
+    if raw:
+        record['raw'] = entity.raw
+    return record
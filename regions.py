@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Author   : Evan Elias Young
+Date     : 2026-10-18
+Revision : 2026-10-18
+"""
+
+from constants import *
+from typing import Optional, Union, List, Dict, Tuple, Iterable, Any
+from concurrent.futures import ThreadPoolExecutor, Future
+from results import iTunesResponse, iTunesResult
+from client import iTunesClient
+from album import Album
+from artist import Artist
+from track import Track
+from wrapper import search, result_id, build_entity
+
+# The fields that differ between storefronts.
+REGIONAL_FIELDS: Tuple[str, ...] = ('country', 'currency', 'collectionPrice',
+                                    'trackPrice', 'collectionViewUrl',
+                                    'trackViewUrl', 'artistViewUrl')
+
+
+class RegionalResult:
+    """Represents one entity as sold in several storefronts.
+    """
+    # The raw data from the first storefront it was found in.
+    raw: iTunesResult
+    # The storefront specific fields by country code.
+    offers: Dict[str, Dict[str, Any]]
+
+    def __init__(self, raw: iTunesResult) -> None:
+        self.raw = raw
+        self.offers = {}
+
+    def add(self, country: str, raw: iTunesResult) -> None:
+        """Records the storefront specific fields of one storefront.
+
+        Arguments:
+            country {str} -- The storefront country code.
+            raw {iTunesResult} -- The raw data from that storefront.
+        """
+        self.offers[country] = {
+            field: raw[field]
+            for field in REGIONAL_FIELDS if field in raw
+        }
+
+    def entity(self) -> Union[Artist, Album, Track]:
+        """Builds the entity from the first storefront it was found in.
+
+        Returns:
+            Union[Artist, Album, Track] -- The entity.
+        """
+        return build_entity(self.raw)
+
+    @property
+    def countries(self) -> List[str]:
+        """The storefronts the entity is available in.
+        """
+        return list(self.offers)
+
+
+def search_countries(
+        term: str,
+        entity: str,
+        countries: Iterable[str],
+        client: Optional[iTunesClient] = None,
+        limit: int = SEARCH_LIMIT,
+        workers: int = FANOUT_WORKERS
+) -> Tuple[Dict[Tuple[str, int], RegionalResult], Dict[str, Exception]]:
+    """Searches several storefronts at once and merges the results.
+
+    The requests share the client's rate limiter, so the fan-out is still
+    held to the store's limits. A storefront that fails is reported in the
+    errors, and the others are merged without it.
+
+    Arguments:
+        term {str} -- The search term.
+        entity {str} -- The entity type(s).
+        countries {Iterable[str]} -- The storefront country codes.
+
+    Keyword Arguments:
+        client {Optional[iTunesClient]} -- The client to send the requests with. (default: {None})
+        limit {int} -- The max number of results per storefront. (default: {SEARCH_LIMIT})
+        workers {int} -- The max number of storefronts searched at once. (default: {FANOUT_WORKERS})
+
+    Returns:
+        Tuple[Dict[Tuple[str, int], RegionalResult], Dict[str, Exception]] -- The merged results by wrapper type and id, and the errors by storefront.
+    """
+    # The storefronts without duplicates, in their original order.
+    unique: List[str] = list(dict.fromkeys(c.upper() for c in countries))
+    # The merged results by wrapper type and id.
+    merged: Dict[Tuple[str, int], RegionalResult] = {}
+
+    # The errors by storefront.
+    errors: Dict[str, Exception] = {}
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # The pending responses by storefront, in their original order.
+        futures: Dict[str, Future] = {
+            country: executor.submit(search, term, entity, client, limit, 0,
+                                     country)
+            for country in unique
+        }
+        for country, future in futures.items():
+            # The response of the storefront.
+            data: iTunesResponse
+            try:
+                data = future.result()
+            except (OSError, ValueError, KeyError) as err:
+                # Network, status and decode errors fail their storefront only.
+                errors[country] = err
+                continue
+            for raw_ent in data['results']:
+                # The wrapper type and id of the result.
+                key: Tuple[str, int] = (raw_ent['wrapperType'],
+                                        result_id(raw_ent))
+                if key not in merged:
+                    merged[key] = RegionalResult(raw_ent)
+                merged[key].add(country, raw_ent)
+    return merged, errors
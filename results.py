@@ -2,10 +2,10 @@
 """
 Author   : Evan Elias Young
 Date     : 2020-03-14
-Revision : 2020-03-14
+Revision : 2026-10-18
 """
 
-from typing import List, Union, TypedDict
+from typing import Optional, List, Dict, Union, TypedDict
 
 
 class AlbumResult(TypedDict):
@@ -66,8 +66,8 @@ class TrackResult(TypedDict):
     artworkUrl30: str
     artworkUrl60: str
     artworkUrl100: str
-    collectionPrice: int
-    trackPrice: int
+    collectionPrice: float
+    trackPrice: float
     releaseDate: str
     collectionExplicitness: str
     trackExplicitness: str
@@ -85,6 +85,55 @@ class TrackResult(TypedDict):
 iTunesResult = Union[AlbumResult, ArtistResult, TrackResult]
 
 
+# The kind of entity each known wrapper type describes.
+WRAPPER_KINDS: Dict[str, str] = {
+    'artist': 'artist',
+    'collection': 'collection',
+    'audiobook': 'collection',
+    'track': 'track'
+}
+
+
+def result_kind(data: iTunesResult) -> str:
+    """Gets the kind of entity a result describes.
+
+    Other wrapper types, such as software, are told apart by their ids: a
+    result with a track and an album is a track, one with only an album is an
+    album, and anything else is treated as its artist.
+
+    Arguments:
+        data {iTunesResult} -- The raw data returned by iTunes.
+
+    Returns:
+        str -- Either artist, collection or track.
+    """
+    # The kind of the wrapper type, if known.
+    kind: Optional[str] = WRAPPER_KINDS.get(data.get('wrapperType'))
+    if kind is not None:
+        return kind
+    if 'collectionId' in data:
+        return 'track' if 'trackId' in data else 'collection'
+    return 'artist'
+
+
+def result_id(data: iTunesResult) -> int:
+    """Gets the id of the entity a result describes.
+
+    Arguments:
+        data {iTunesResult} -- The raw data returned by iTunes.
+
+    Returns:
+        int -- The entity id.
+    """
+    # The kind of entity the result describes.
+    kind: str = result_kind(data)
+    if kind == 'collection':
+        return data['collectionId']
+    elif kind == 'track':
+        return data['trackId']
+    return data['artistId']
+
+
 class iTunesResponse(TypedDict):
     """Represents a response from iTunes.
     """
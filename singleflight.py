@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Author   : Evan Elias Young
+Date     : 2026-10-18
+Revision : 2026-10-18
+"""
+
+from typing import Optional, Dict, Callable, Awaitable, TypeVar
+from concurrent.futures import Future
+import asyncio
+import threading
+
+T = TypeVar('T')
+
+
+class SingleFlight:
+    """Represents a set of in-flight calls that identical callers share.
+    """
+    # The in-flight calls by key.
+    flights: Dict[str, 'Future[object]']
+    # The number of calls actually executed.
+    executed: int
+    # The number of calls that waited on an in-flight call instead.
+    coalesced: int
+    # The lock guarding the in-flight calls.
+    lock: threading.Lock
+
+    def __init__(self) -> None:
+        self.flights = {}
+        self.executed = 0
+        self.coalesced = 0
+        self.lock = threading.Lock()
+
+    def do(self, key: str, func: Callable[[], T]) -> T:
+        """Calls a function, unless a call with the same key is in flight.
+
+        Arguments:
+            key {str} -- The key identifying identical calls.
+            func {Callable[[], T]} -- The function to call.
+
+        Returns:
+            T -- The result of the call, shared by every waiting caller.
+        """
+        # The call to wait on, or to run.
+        flight: Optional['Future[object]']
+        with self.lock:
+            flight = self.flights.get(key)
+            # Whether or not this caller runs the call.
+            leader: bool = flight is None
+            if flight is None:
+                self.executed += 1
+                flight = self.flights[key] = Future()
+            else:
+                self.coalesced += 1
+        if not leader:
+            return flight.result()  # type: ignore
+        try:
+            result: T = func()
+        except BaseException as err:
+            self._finish(key)
+            flight.set_exception(err)
+            raise
+        self._finish(key)
+        flight.set_result(result)
+        return result
+
+    def _finish(self, key: str) -> None:
+        """Removes a call from the in-flight calls.
+
+        Arguments:
+            key {str} -- The key identifying identical calls.
+        """
+        with self.lock:
+            del self.flights[key]
+
+
+class AsyncSingleFlight:
+    """Represents a set of in-flight coroutines that identical callers share.
+
+    Each call runs as its own task, so cancelling one caller, even the one
+    that started the call, leaves the others waiting on it.
+    """
+    # The in-flight calls by key.
+    flights: Dict[str, 'asyncio.Future[object]']
+    # The number of calls actually executed.
+    executed: int
+    # The number of calls that waited on an in-flight call instead.
+    coalesced: int
+
+    def __init__(self) -> None:
+        self.flights = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, func: Callable[[], Awaitable[T]]) -> T:
+        """Awaits a coroutine, unless one with the same key is in flight.
+
+        Arguments:
+            key {str} -- The key identifying identical calls.
+            func {Callable[[], Awaitable[T]]} -- The coroutine function to await.
+
+        Returns:
+            T -- The result of the call, shared by every waiting caller.
+        """
+        # The call to wait on, or to run.
+        flight: Optional['asyncio.Future[object]'] = self.flights.get(key)
+        if flight is None:
+            self.executed += 1
+            flight = self.flights[key] = asyncio.ensure_future(func())
+            flight.add_done_callback(
+                lambda done, key=key: self._finish(key, done))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(flight)  # type: ignore
+
+    def _finish(self, key: str, flight: 'asyncio.Future[object]') -> None:
+        """Removes a finished call from the in-flight calls.
+
+        Arguments:
+            key {str} -- The key identifying identical calls.
+            flight {asyncio.Future[object]} -- The finished call.
+        """
+        if self.flights.get(key) is flight:
+            del self.flights[key]
+        if not flight.cancelled():
+            # Mark the error as retrieved when every caller was cancelled.
+            flight.exception()
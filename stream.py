@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Author   : Evan Elias Young
+Date     : 2026-10-18
+Revision : 2026-10-18
+"""
+
+from constants import *
+from typing import Optional, List, Dict, Iterable, Iterator, Any
+import re
+import codec
+from results import iTunesResult
+from client import iTunesClient, get_client
+
+# The braces of an object, and its strings, the closing quote in group 1
+# unless the string is still being received.
+OBJECT_TOKENS: 're.Pattern[bytes]' = re.compile(
+    rb'[{}]|"(?:[^"\\]+|\\.)*(")?', re.DOTALL)
+# The first byte of the next array item, or the end of the array.
+ARRAY_ITEM: 're.Pattern[bytes]' = re.compile(rb'[^\s,]')
+# The byte opening a string.
+QUOTE: int = ord('"')
+# The byte opening an object.
+OPEN_BRACE: int = ord('{')
+# The byte closing an array.
+CLOSE_BRACKET: int = ord(']')
+# The key of the results array, then its opening bracket.
+RESULTS_KEY: 're.Pattern[bytes]' = re.compile(rb'"results"\s*:\s*\[')
+# The start of the key of the results array, cut off by the end of a chunk.
+PARTIAL_KEY: 're.Pattern[bytes]' = re.compile(
+    rb'"(?:r(?:e(?:s(?:u(?:l(?:t(?:s(?:"\s*(?::\s*)?)?)?)?)?)?)?)?)?\Z')
+
+
+class ResultsParser:
+    """Represents an incremental parser of the results array of a response.
+
+    Only the result being received is buffered, each one is decoded on its
+    own as soon as its closing brace arrives.
+    """
+    # The bytes received but not yet decoded.
+    buffer: bytearray
+    # The position in the buffer scanned up to.
+    pos: int
+    # The nesting depth inside the current result, 0 between results.
+    depth: int
+    # Whether or not the results array was opened.
+    started: bool
+    # Whether or not the results array was closed.
+    done: bool
+
+    def __init__(self) -> None:
+        self.buffer = bytearray()
+        self.pos = 0
+        self.depth = 0
+        self.started = False
+        self.done = False
+
+    def feed(self, chunk: bytes) -> List[iTunesResult]:
+        """Adds bytes of the response body.
+
+        Arguments:
+            chunk {bytes} -- The next bytes of the response body.
+
+        Raises:
+            ValueError: The results array holds something other than objects.
+
+        Returns:
+            List[iTunesResult] -- The results completed by the bytes.
+        """
+        # The results completed by the bytes.
+        results: List[iTunesResult] = []
+        if self.done:
+            return results
+        self.buffer += chunk
+        if not self.started and not self._seek():
+            return results
+        while self._scan():
+            results.append(codec.decoder(bytes(self.buffer[:self.pos])))
+            del self.buffer[:self.pos]
+            self.pos = 0
+        return results
+
+    def _seek(self) -> bool:
+        """Skips the bytes before the results array.
+
+        Returns:
+            bool -- Whether or not the results array was opened.
+        """
+        # The key of the results array.
+        match: Optional[re.Match] = RESULTS_KEY.search(self.buffer)
+        if match is None:
+            # Keep the key split across chunks, however long its spacing.
+            match = PARTIAL_KEY.search(self.buffer)
+            # The start of the bytes to keep.
+            keep: int = len(self.buffer) if match is None else match.start()
+            del self.buffer[:keep]
+            return False
+        del self.buffer[:match.end()]
+        self.started = True
+        return True
+
+    def _scan(self) -> bool:
+        """Scans the buffer up to the end of the next result.
+
+        Raises:
+            ValueError: The results array holds something other than objects.
+
+        Returns:
+            bool -- Whether or not a result is complete, False when more bytes are needed or the array closed.
+        """
+        # The next token found.
+        match: Optional[re.Match]
+        if self.depth == 0:
+            match = ARRAY_ITEM.search(self.buffer, self.pos)
+            if match is None:
+                del self.buffer[:]
+                self.pos = 0
+                return False
+            if self.buffer[match.start()] == CLOSE_BRACKET:
+                self.done = True
+                del self.buffer[:]
+                return False
+            if self.buffer[match.start()] != OPEN_BRACE:
+                raise ValueError('results must be an array of objects')
+            del self.buffer[:match.start()]
+            self.pos = 1
+            self.depth = 1
+        for match in OBJECT_TOKENS.finditer(self.buffer, self.pos):
+            # The first byte of the token.
+            token: int = self.buffer[match.start()]
+            if token == QUOTE:
+                if match.group(1) is None:
+                    # Rescan the string once the rest of it arrives.
+                    self.pos = match.start()
+                    return False
+            elif token == OPEN_BRACE:
+                self.depth += 1
+            else:
+                self.depth -= 1
+                if self.depth == 0:
+                    self.pos = match.end()
+                    return True
+        self.pos = len(self.buffer)
+        return False
+
+    def close(self) -> None:
+        """Checks that the whole results array was received.
+
+        Raises:
+            ValueError: The response ended before the results array did.
+        """
+        if not self.done:
+            raise ValueError('response ended inside the results array')
+
+
+def iter_results(chunks: Iterable[bytes]) -> Iterator[iTunesResult]:
+    """Parses the results of a response body as its chunks arrive.
+
+    Arguments:
+        chunks {Iterable[bytes]} -- The chunks of the response body.
+
+    Raises:
+        ValueError: The response is not a complete results array.
+
+    Returns:
+        Iterator[iTunesResult] -- Each result, as soon as it is complete.
+    """
+    # The parser of the results array.
+    parser: ResultsParser = ResultsParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    parser.close()
+
+
+def stream_results(
+        endpoint: str,
+        params: Dict[str, Any],
+        client: Optional[iTunesClient] = None) -> Iterator[iTunesResult]:
+    """Sends a request, yielding each result as soon as it is downloaded.
+
+    Arguments:
+        endpoint {str} -- The endpoint name, such as search or lookup.
+        params {Dict[str, Any]} -- The query parameters.
+
+    Keyword Arguments:
+        client {Optional[iTunesClient]} -- The client to send the request with. (default: {None})
+
+    Returns:
+        Iterator[iTunesResult] -- The raw data returned by iTunes.
+    """
+    return iter_results(get_client(client).stream(endpoint, params))
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Author   : Evan Elias Young
+Date     : 2026-10-18
+Revision : 2026-10-18
+"""
+
+from constants import *
+from typing import Optional, List, Dict, Any
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qsl, ParseResult
+import json
+import os
+import threading
+from results import iTunesResult
+from index import ENTITY_WRAPPERS
+
+# The recorded responses replayed by the stub server.
+FIXTURES_PATH: str = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                  'fixtures', 'search.json')
+
+
+def load_fixtures(path: str = FIXTURES_PATH) -> Dict[str, iTunesResult]:
+    """Loads one recorded result per wrapper type.
+
+    Keyword Arguments:
+        path {str} -- The recorded response. (default: {FIXTURES_PATH})
+
+    Returns:
+        Dict[str, iTunesResult] -- The recorded results by wrapper type.
+    """
+    with open(path, encoding='utf-8') as file:
+        return {r['wrapperType']: r for r in json.load(file)['results']}
+
+
+def replay_results(template: iTunesResult,
+                   count: int,
+                   offset: int = 0) -> List[iTunesResult]:
+    """Clones a recorded result, with 12 tracks per album and 4 albums per artist.
+
+    Arguments:
+        template {iTunesResult} -- The recorded result.
+        count {int} -- The number of results.
+
+    Keyword Arguments:
+        offset {int} -- The index of the first result. (default: {0})
+
+    Returns:
+        List[iTunesResult] -- The results, each with its own ids and names.
+    """
+    # The results replayed.
+    results: List[iTunesResult] = []
+    for i in range(offset, offset + count):
+        # The clone of the recorded result.
+        raw: Dict[str, Any] = dict(template)
+        if raw['wrapperType'] == 'track':
+            raw['trackId'] += i
+            raw['trackName'] = raw['trackCensoredName'] = f'Track {i}'
+            raw['trackNumber'] = i % 12 + 1
+            raw['collectionId'] += i // 12
+            raw['artistId'] += i // 48
+        elif raw['wrapperType'] == 'collection':
+            raw['collectionId'] += i
+            raw['collectionName'] = raw['collectionCensoredName'] = \
+                f'Album {i}'
+            raw['artistId'] += i // 4
+        else:
+            raw['artistId'] += i
+            raw['artistName'] = f'Artist {i}'
+        results.append(raw)
+    return results
+
+
+def replay_body(template: iTunesResult, count: int, offset: int = 0) -> bytes:
+    """Builds a response body framed the way iTunes frames it.
+
+    Arguments:
+        template {iTunesResult} -- The recorded result.
+        count {int} -- The number of results.
+
+    Keyword Arguments:
+        offset {int} -- The index of the first result. (default: {0})
+
+    Returns:
+        bytes -- The response body.
+    """
+    # The results of the response.
+    results: List[iTunesResult] = replay_results(template, count, offset)
+    return b'\n\n\n' + json.dumps({
+        'resultCount': len(results),
+        'results': results
+    }).encode('utf-8') + b'\n\n\n'
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Represents the replies of the stub server to a connection.
+    """
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    # The stub server replying.
+    server: 'StubServer'
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        # The requested url.
+        url: ParseResult = urlparse(self.path)
+        # The query parameters.
+        params: Dict[str, str] = dict(parse_qsl(url.query))
+        self.server.count += 1
+        if self.server.take_throttle():
+            self.send_response(429)
+            self.send_header('Retry-After', '0')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        # The recorded result to replay.
+        template: Optional[iTunesResult] = None
+        # The number of results to replay.
+        count: int = 0
+        if url.path == '/search':
+            template = self.server.fixtures.get(
+                ENTITY_WRAPPERS.get(params.get('entity', 'song'), 'track'))
+            count = int(params.get('limit', SEARCH_LIMIT))
+        elif url.path == '/lookup':
+            template = self.server.fixtures['track']
+            count = len(params.get('id', '').split(','))
+        if template is None:
+            self.send_error(404)
+            return
+        # The response body.
+        body: bytes = replay_body(template, count,
+                                  int(params.get('offset', 0)))
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/javascript; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class StubServer(ThreadingHTTPServer):
+    """Represents a local server replaying recorded iTunes responses.
+    """
+    daemon_threads = True
+    # The recorded results by wrapper type.
+    fixtures: Dict[str, iTunesResult]
+    # The number of requests received.
+    count: int
+    # The number of requests still to answer with a throttle response.
+    throttles: int
+    # The lock guarding the throttles.
+    lock: threading.Lock
+
+    def __init__(self,
+                 path: str = FIXTURES_PATH,
+                 port: int = 0,
+                 throttles: int = 0) -> None:
+        """Binds the server to a local port, without serving yet.
+
+        Keyword Arguments:
+            path {str} -- The recorded response. (default: {FIXTURES_PATH})
+            port {int} -- The port, 0 for any free port. (default: {0})
+            throttles {int} -- The number of requests to answer with a throttle response first. (default: {0})
+        """
+        super().__init__(('127.0.0.1', port), StubHandler)
+        self.fixtures = load_fixtures(path)
+        self.count = 0
+        self.throttles = throttles
+        self.lock = threading.Lock()
+
+    def take_throttle(self) -> bool:
+        """Takes one of the throttle responses still to send.
+
+        Returns:
+            bool -- Whether or not the request should be throttled.
+        """
+        with self.lock:
+            if self.throttles <= 0:
+                return False
+            self.throttles -= 1
+            return True
+
+    @property
+    def url(self) -> str:
+        """The base url to pass to a client.
+        """
+        return f'http://127.0.0.1:{self.server_address[1]}'
+
+    def start(self) -> 'StubServer':
+        """Serves requests in a background thread.
+
+        Returns:
+            StubServer -- The server.
+        """
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def close(self) -> None:
+        """Stops serving and releases the port.
+        """
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self) -> 'StubServer':
+        return self.start()
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
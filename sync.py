@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Author   : Evan Elias Young
+Date     : 2026-10-18
+Revision : 2026-10-18
+"""
+
+from constants import *
+from typing import Optional, List, Dict, Tuple, Iterable
+import hashlib
+import json
+import sqlite3
+import time
+from results import iTunesResult
+from client import iTunesClient
+from wrapper import lookup_many, iter_chunk_ids
+
+
+def fingerprint(raw: iTunesResult) -> str:
+    """Hashes the content of a result, independent of its key order.
+
+    Arguments:
+        raw {iTunesResult} -- The raw data returned by iTunes.
+
+    Returns:
+        str -- The fingerprint.
+    """
+    return hashlib.sha1(
+        json.dumps(raw, sort_keys=True,
+                   separators=(',', ':')).encode('utf-8')).hexdigest()
+
+
+class CatalogSync:
+    """Represents a local mirror of entities, refreshed by staleness.
+
+    Entities that keep changing are checked every SYNC_MIN_INTERVAL, and the
+    interval doubles each time an entity is found unchanged, up to
+    SYNC_MAX_INTERVAL, so each run scales with churn rather than catalog size.
+    """
+    # The path to the database file.
+    path: str
+    # The connection to the database file.
+    conn: sqlite3.Connection
+    # The client to send the lookups with.
+    client: Optional[iTunesClient]
+
+    def __init__(self,
+                 path: str = SYNC_PATH,
+                 client: Optional[iTunesClient] = None) -> None:
+        self.path = path
+        self.client = client
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('CREATE TABLE IF NOT EXISTS records ('
+                          'uid INTEGER PRIMARY KEY, fingerprint TEXT, '
+                          'raw TEXT, due REAL NOT NULL, '
+                          'interval REAL NOT NULL, checked REAL)')
+        self.conn.execute(
+            'CREATE INDEX IF NOT EXISTS records_due ON records (due)')
+        self.conn.commit()
+
+    def follow(self, ids: Iterable[int]) -> None:
+        """Adds entities to the mirror, due for their first lookup.
+
+        Arguments:
+            ids {Iterable[int]} -- The entity ids.
+        """
+        self.conn.executemany(
+            'INSERT OR IGNORE INTO records (uid, due, interval) '
+            'VALUES (?, 0, ?)', ((uid, SYNC_MIN_INTERVAL) for uid in ids))
+        self.conn.commit()
+
+    def due(self,
+            limit: Optional[int] = None,
+            now: Optional[float] = None) -> List[int]:
+        """Lists the entities due for a lookup, most overdue first.
+
+        Keyword Arguments:
+            limit {Optional[int]} -- The max number of ids, None for all. (default: {None})
+            now {Optional[float]} -- The current time. (default: {None})
+
+        Returns:
+            List[int] -- The entity ids.
+        """
+        return [
+            uid for uid, in self.conn.execute(
+                'SELECT uid FROM records WHERE due <= ? ORDER BY due LIMIT ?',
+                (time.time() if now is None else now,
+                 -1 if limit is None else limit))
+        ]
+
+    def run(self, limit: Optional[int] = None) -> Dict[str, int]:
+        """Looks up the due entities in batches and stores what changed.
+
+        Each batch is committed as soon as it is stored, so a failed batch
+        is counted and left due for the next run without losing the others.
+
+        Keyword Arguments:
+            limit {Optional[int]} -- The max number of entities to check, None for all. (default: {None})
+
+        Returns:
+            Dict[str, int] -- The number of entities checked, changed, unchanged, missing and failed.
+        """
+        # The current time.
+        now: float = time.time()
+        # The counters of the run.
+        report: Dict[str, int] = {
+            'checked': 0,
+            'changed': 0,
+            'unchanged': 0,
+            'missing': 0,
+            'failed': 0
+        }
+
+        for chunk in iter_chunk_ids(self.due(limit, now)):
+            # The raw data of the batch by id.
+            found: Dict[int, Optional[iTunesResult]]
+            try:
+                found = lookup_many(chunk, self.client)
+            except (OSError, ValueError, KeyError):
+                # Network, status and decode errors fail their batch only.
+                report['failed'] += len(chunk)
+                continue
+            # The stored fingerprints and intervals by id.
+            known: Dict[int, Tuple[Optional[str], float]] = {
+                uid: (fp, interval)
+                for uid, fp, interval in self.conn.execute(
+                    'SELECT uid, fingerprint, interval FROM records '
+                    'WHERE uid IN ({})'.format(','.join('?' * len(chunk))),
+                    chunk)
+            }
+            report['checked'] += len(found)
+            for uid, raw in found.items():
+                self._store(uid, raw, known[uid], now, report)
+            self.conn.commit()
+        return report
+
+    def _store(self, uid: int, raw: Optional[iTunesResult],
+               known: Tuple[Optional[str], float], now: float,
+               report: Dict[str, int]) -> None:
+        """Stores the result of a lookup and schedules the next one.
+
+        Arguments:
+            uid {int} -- The entity id.
+            raw {Optional[iTunesResult]} -- The raw data returned by iTunes, None if missing.
+            known {Tuple[Optional[str], float]} -- The stored fingerprint and interval.
+            now {float} -- The current time.
+            report {Dict[str, int]} -- The counters of the run.
+        """
+        # The stored fingerprint and interval.
+        old_fp, interval = known
+        # The fingerprint of the current content.
+        new_fp: Optional[str] = fingerprint(raw) if raw else None
+        if new_fp is None or new_fp == old_fp:
+            # Back off on entities that do not change.
+            report['missing' if new_fp is None else 'unchanged'] += 1
+            interval = min(interval * 2, SYNC_MAX_INTERVAL)
+            self.conn.execute(
+                'UPDATE records SET due = ?, interval = ?, checked = ? '
+                'WHERE uid = ?', (now + interval, interval, now, uid))
+        else:
+            report['changed'] += 1
+            interval = SYNC_MIN_INTERVAL
+            self.conn.execute(
+                'UPDATE records SET fingerprint = ?, raw = ?, due = ?, '
+                'interval = ?, checked = ? WHERE uid = ?',
+                (new_fp, json.dumps(raw), now + interval, interval, now, uid))
+
+    def get(self, uid: int) -> Optional[iTunesResult]:
+        """Gets the mirrored raw data of an entity.
+
+        Arguments:
+            uid {int} -- The entity id.
+
+        Returns:
+            Optional[iTunesResult] -- The raw data, None if never found.
+        """
+        # The stored raw data.
+        row: Optional[Tuple[Optional[str]]] = self.conn.execute(
+            'SELECT raw FROM records WHERE uid = ?', (uid, )).fetchone()
+        return json.loads(row[0]) if row and row[0] else None
+
+    def close(self) -> None:
+        """Closes the database file.
+        """
+        self.conn.close()
+
+    def __len__(self) -> int:
+        return self.conn.execute('SELECT COUNT(*) FROM records').fetchone()[0]
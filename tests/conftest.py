@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+Author   : Evan Elias Young
+Date     : 2026-10-18
+Revision : 2026-10-18
+"""
+
+from typing import Iterator
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stubserver import StubServer
+
+
+@pytest.fixture
+def server() -> Iterator[StubServer]:
+    """Serves the recorded responses for one test.
+
+    Returns:
+        Iterator[StubServer] -- The running stub server.
+    """
+    with StubServer() as stub:
+        yield stub
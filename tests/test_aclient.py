@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Author   : Evan Elias Young
+Date     : 2026-10-18
+Revision : 2026-10-18
+"""
+
+from typing import Tuple, Callable, Awaitable, Any
+import asyncio
+import aiohttp
+import pytest
+from aclient import AsynciTunesClient
+from cache import LRUCache
+from metrics import Collector
+from ratelimit import RateLimiter
+from stubserver import StubServer
+
+
+def run(server: StubServer, func: Callable[[AsynciTunesClient], Awaitable],
+        **options: Any) -> Tuple[Any, AsynciTunesClient]:
+    """Sends requests through a new async client in a new event loop.
+
+    Arguments:
+        server {StubServer} -- The stub server to send the requests to.
+        func {Callable[[AsynciTunesClient], Awaitable]} -- The function sending the requests.
+
+    Keyword Arguments:
+        options {Any} -- The client options, without a limiter unless given.
+
+    Returns:
+        Tuple[Any, AsynciTunesClient] -- The result of the function, and the closed client.
+    """
+    options.setdefault('limiter', None)
+
+    async def main() -> Tuple[Any, AsynciTunesClient]:
+        async with AsynciTunesClient(server.url, **options) as client:
+            return await func(client), client
+
+    return asyncio.run(main())
+
+
+def test_search(server: StubServer) -> None:
+    response, _ = run(server, lambda c: c.search('jack johnson', 'song'))
+    assert response['resultCount'] == 10
+    assert response['results'][1]['trackName'] == 'Track 1'
+    assert server.count == 1
+
+
+def test_search_entities_share_parents(server: StubServer) -> None:
+    tracks, _ = run(server,
+                    lambda c: c.search_entities('jack johnson', 'song'))
+    assert [t.type for t in tracks] == ['Track'] * 10
+    assert all(t.album is tracks[0].album for t in tracks)
+    assert all(t.artist is t.album.artist for t in tracks)
+
+
+def test_lookup(server: StubServer) -> None:
+    results, _ = run(server, lambda c: c.lookup(1, 'song', 5))
+    entity, _ = run(server, lambda c: c.lookup_entity(2))
+    assert results[0]['wrapperType'] == 'track'
+    assert entity.type == 'Track'
+    assert server.count == 2
+
+
+def test_identical_requests_coalesce(server: StubServer) -> None:
+    responses, client = run(
+        server, lambda c: asyncio.gather(
+            *(c.search('jack johnson', 'song') for _ in range(5))))
+    assert server.count == 1
+    assert client.stats()['coalesced'] == 4
+    assert all(r == responses[0] for r in responses)
+
+
+def test_cache_counts_first_miss(server: StubServer) -> None:
+    # The cache, empty when the first request is sent.
+    cache: LRUCache = LRUCache()
+    for term in ('a', 'a', 'b'):
+        run(server, lambda c: c.search(term, 'song'), cache=cache)
+    assert cache.stats()['hits'] == 1
+    assert cache.stats()['misses'] == 2
+    assert server.count == 2
+
+
+def test_throttle_retry() -> None:
+    # The metrics of the retries.
+    metrics: Collector = Collector()
+    with StubServer(throttles=2) as server:
+        response, _ = run(server,
+                          lambda c: c.search('jack johnson', 'song'),
+                          retries=2,
+                          metrics=metrics)
+        assert server.count == 3
+    assert response['resultCount'] == 10
+    assert metrics.summary()[
+        'retries{endpoint="search",reason="throttle"}'] == 2
+
+
+def test_throttle_slows_limiter() -> None:
+    # The limiter told about the throttle.
+    limiter: RateLimiter = RateLimiter(100, 10)
+    with StubServer(throttles=1) as server:
+        response, _ = run(server,
+                          lambda c: c.search('jack johnson', 'song'),
+                          limiter=limiter)
+    assert response['resultCount'] == 10
+    assert limiter.throttles == 1
+    assert limiter.requests == 2
+
+
+def test_throttle_gives_up() -> None:
+    with StubServer(throttles=3) as server:
+        with pytest.raises(aiohttp.ClientResponseError) as info:
+            run(server,
+                lambda c: c.search('jack johnson', 'song'),
+                retries=1)
+        assert server.count == 2
+    assert info.value.status == 429
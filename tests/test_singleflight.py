@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Author   : Evan Elias Young
+Date     : 2026-10-18
+Revision : 2026-10-18
+"""
+
+from typing import List
+import asyncio
+import pytest
+from singleflight import AsyncSingleFlight
+
+
+def test_cancelled_leader_leaves_followers_waiting() -> None:
+
+    async def main() -> None:
+        # The calls shared by the callers.
+        flights: AsyncSingleFlight = AsyncSingleFlight()
+        # The signal letting the fetch finish.
+        release: asyncio.Event = asyncio.Event()
+
+        async def fetch() -> bytes:
+            await release.wait()
+            return b'body'
+
+        leader: asyncio.Task = asyncio.ensure_future(flights.do('k', fetch))
+        await asyncio.sleep(0)
+        follower: asyncio.Task = asyncio.ensure_future(flights.do('k', fetch))
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        assert await follower == b'body'
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        assert (flights.executed, flights.coalesced) == (1, 1)
+        assert not flights.flights
+
+    asyncio.run(main())
+
+
+def test_errors_reach_every_caller() -> None:
+
+    async def main() -> None:
+        # The calls shared by the callers.
+        flights: AsyncSingleFlight = AsyncSingleFlight()
+
+        async def fetch() -> bytes:
+            await asyncio.sleep(0)
+            raise ValueError('bad body')
+
+        # The outcome of each caller.
+        results: List[object] = await asyncio.gather(flights.do('k', fetch),
+                                       flights.do('k', fetch),
+                                       return_exceptions=True)
+        assert [type(r) for r in results] == [ValueError, ValueError]
+        assert not flights.flights
+
+    asyncio.run(main())
@@ -2,20 +2,22 @@
 """
 Author   : Evan Elias Young
 Date     : 2020-03-14
-Revision : 2020-03-14
+Revision : 2026-10-18
 """
 
 from constants import *
 from typing_extensions import Protocol
-from typing import Dict
+from typing import Dict, Optional
 from datetime import datetime as dt
+from dates import Dated
 from results import AlbumResult, ArtistResult, TrackResult, iTunesResult
 from artist import Artist
 from album import Album
 from utils import align_dict
+from identity import IdentityMap
 
 
-class Track:
+class Track(Dated):
     """Represents an iTunes Track.
     """
     # The raw data from iTunes.
@@ -30,8 +32,8 @@ class Track:
     name: str
     # The country where the album was released.
     country: str
-    # The release date of the album.
-    date: dt
+    # The release date of the album, as sent by iTunes.
+    release: str
     # The length of the track in seconds.
     time: float
     # The genre of the track.
@@ -41,20 +43,24 @@ class Track:
         self.type = 'Track'
 
     @staticmethod
-    def from_result(result: TrackResult) -> 'Track':
+    def from_result(result: TrackResult,
+                    idmap: Optional[IdentityMap] = None) -> 'Track':
         track: Track = Track()
 
         track.raw = result
-        track.artist = Artist.from_track_result(result)
-        track.album = Album.from_track_result(result)
+        track.album = Album.from_track_result(result, idmap)
+        # The album already holds the same artist.
+        track.artist = track.album.artist
         track.uid = result['trackId']
         track.name = result['trackCensoredName'] if CENSORED else result[
             'trackName']
         track.country = result['country']
-        track.date = dt.strptime(result['releaseDate'], '%Y-%m-%dT%H:%M:%SZ')
+        track.set_release(result['releaseDate'])
         track.time = result['trackTimeMillis'] / 1000
         track.genre = result['primaryGenreName']
 
+        if idmap is not None:
+            idmap.put(track.type, track.uid, track)
         return track
 
     def __str__(self) -> str:
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Author   : Evan Elias Young
+Date     : 2026-10-18
+Revision : 2026-10-18
+"""
+
+from constants import *
+from typing import Optional, List, Tuple, Callable
+from collections import OrderedDict
+import threading
+import time
+from results import iTunesResult
+from client import iTunesClient, get_client
+from ratelimit import RateLimiter
+from wrapper import search
+
+
+def normalize_term(term: str) -> str:
+    """Normalizes a search term the way iTunes matches it.
+
+    Arguments:
+        term {str} -- The search term.
+
+    Returns:
+        str -- The lowercase term, with single spaces between words.
+    """
+    return ' '.join(term.lower().split())
+
+
+def matches(raw: iTunesResult, words: List[str]) -> bool:
+    """Checks whether every word prefixes a word of the result names.
+
+    Arguments:
+        raw {iTunesResult} -- The raw data returned by iTunes.
+        words {List[str]} -- The lowercase words of the term.
+
+    Returns:
+        bool -- Whether or not the result matches.
+    """
+    # The words of the track, album and artist names.
+    names: List[str] = ' '.join(
+        raw.get(field) or ''
+        for field in ('trackName', 'collectionName', 'artistName')).lower(
+        ).split()
+    return all(any(name.startswith(word) for name in names) for word in words)
+
+
+class PrefixCache:
+    """Represents the results of answered terms, reused for longer terms.
+
+    A term extending an answered one is served by filtering the answer, as a
+    first guess only. iTunes does not promise a longer term returns a subset
+    of a shorter one, so only an answer for the exact term is final.
+    """
+    # The results by normalized term, least recently used first.
+    entries: 'OrderedDict[str, List[iTunesResult]]'
+    # The max number of results per request.
+    limit: int
+    # The max number of terms kept.
+    size: int
+    # The lock guarding the entries.
+    lock: threading.Lock
+
+    def __init__(self,
+                 limit: int = TYPEAHEAD_LIMIT,
+                 size: int = TYPEAHEAD_CACHE_SIZE) -> None:
+        self.entries = OrderedDict()
+        self.limit = limit
+        self.size = size
+        self.lock = threading.Lock()
+
+    def get(self, term: str) -> Tuple[Optional[List[iTunesResult]], bool]:
+        """Gets the results of a term, or filters those of its longest prefix.
+
+        Arguments:
+            term {str} -- The search term.
+
+        Returns:
+            Tuple[Optional[List[iTunesResult]], bool] -- The results, None if no prefix was answered, and whether or not they answer the exact term.
+        """
+        # The normalized term.
+        key: str = normalize_term(term)
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                return self.entries[key], True
+            for end in range(len(key) - 1, 0, -1):
+                # The results of the prefix.
+                results: Optional[List[iTunesResult]] = self.entries.get(
+                    key[:end])
+                if results is not None:
+                    self.entries.move_to_end(key[:end])
+                    return [
+                        r for r in results if matches(r, key.split())
+                    ], False
+        return None, False
+
+    def put(self, term: str, results: List[iTunesResult]) -> None:
+        """Stores the results of a term, evicting the least recently used.
+
+        Arguments:
+            term {str} -- The search term.
+            results {List[iTunesResult]} -- The raw data returned by iTunes.
+        """
+        with self.lock:
+            self.entries[normalize_term(term)] = results
+            self.entries.move_to_end(normalize_term(term))
+            while len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+
+
+class Typeahead:
+    """Represents a search sent as the user types.
+
+    Each keystroke shows what the prefix cache knows right away, then sends
+    a request once typing pauses for the debounce delay. A newer keystroke
+    cancels the pending request, and responses for stale terms are cached
+    but never shown.
+    """
+    # The entity type(s) to search for.
+    entity: str
+    # The function showing a term, its results, and whether they are final.
+    show: Callable[[str, List[iTunesResult], bool], None]
+    # The client to send the requests with.
+    client: Optional[iTunesClient]
+    # The seconds typing must pause before a request is sent.
+    delay: float
+    # The answered terms.
+    cache: PrefixCache
+    # The number of the latest keystroke.
+    generation: int
+    # The request waiting for typing to pause, if any.
+    timer: Optional[threading.Timer]
+    # The lock guarding the generation and timer.
+    lock: threading.Lock
+
+    def __init__(self,
+                 entity: str,
+                 show: Callable[[str, List[iTunesResult], bool], None],
+                 client: Optional[iTunesClient] = None,
+                 delay: float = TYPEAHEAD_DELAY,
+                 limit: int = TYPEAHEAD_LIMIT) -> None:
+        """Creates a search, without sending anything yet.
+
+        Arguments:
+            entity {str} -- The entity type(s) to search for.
+            show {Callable[[str, List[iTunesResult], bool], None]} -- The function showing a term, its results, and whether they are final.
+
+        Keyword Arguments:
+            client {Optional[iTunesClient]} -- The client to send the requests with. (default: {None})
+            delay {float} -- The seconds typing must pause before a request is sent. (default: {TYPEAHEAD_DELAY})
+            limit {int} -- The max number of results per request. (default: {TYPEAHEAD_LIMIT})
+        """
+        self.entity = entity
+        self.show = show
+        self.client = client
+        self.delay = delay
+        self.cache = PrefixCache(limit)
+        self.generation = 0
+        self.timer = None
+        self.lock = threading.Lock()
+
+    def update(self, term: str) -> None:
+        """Handles the term changing, showing any cached results right away.
+
+        Arguments:
+            term {str} -- The term typed so far.
+        """
+        with self.lock:
+            self.generation += 1
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            # The number of this keystroke.
+            generation: int = self.generation
+        if not term.strip():
+            self.show(term, [], True)
+            return
+        # The results known for the term, and whether they are final.
+        results: Optional[List[iTunesResult]]
+        final: bool
+        results, final = self.cache.get(term)
+        self.show(term, results or [], final)
+        if final:
+            return
+        with self.lock:
+            if generation == self.generation:
+                self.timer = threading.Timer(self.delay, self._fetch,
+                                             (term, generation))
+                self.timer.daemon = True
+                self.timer.start()
+
+    def _fetch(self, term: str, generation: int) -> None:
+        """Sends the request for a term, unless a newer keystroke came first.
+
+        Arguments:
+            term {str} -- The search term.
+            generation {int} -- The number of the keystroke.
+        """
+        # The limiter the request waits on, if any.
+        limiter: Optional[RateLimiter] = get_client(self.client).limiter
+        while limiter is not None:
+            # The seconds until a token is free.
+            wait: float = limiter.delay()
+            if generation != self.generation or wait <= 0:
+                break
+            # Wait without taking a token, so a newer keystroke can still
+            # cancel the request before it spends one.
+            time.sleep(min(wait, self.delay))
+        if generation != self.generation:
+            return
+        # The raw data returned by iTunes.
+        results: List[iTunesResult]
+        try:
+            results = search(term,
+                             self.entity,
+                             self.client,
+                             limit=self.cache.limit)['results']
+        except (OSError, ValueError):
+            # Network and decode errors leave the cached results shown.
+            return
+        self.cache.put(term, results)
+        if generation == self.generation:
+            self.show(term, results, True)
+
+    def close(self) -> None:
+        """Cancels the pending request, and ignores any in flight.
+        """
+        with self.lock:
+            self.generation += 1
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
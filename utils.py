@@ -2,12 +2,28 @@
 """
 Author   : Evan Elias Young
 Date     : 2020-03-14
-Revision : 2020-03-14
+Revision : 2026-10-18
 """
 
 from constants import *
 from typing import Dict, List, Any
 import os
+import sys
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+try:
+    import termios
+    import tty
+except ImportError:
+    termios = None
+    tty = None
+
+# Whether or not the terminal has been set up for escape codes.
+ANSI_READY: bool = os.name != 'nt'
 
 
 def align_dict(collection: Dict[Any, Any]) -> List[str]:
@@ -41,14 +57,67 @@ def print_centered(text: str, width: int = LINE_LENGTH) -> None:
     print(f'{text:^{width}}')
 
 
+def enable_ansi() -> None:
+    """Turns on escape code processing in the Windows console, once.
+    """
+    global ANSI_READY
+    if ANSI_READY:
+        return
+    ANSI_READY = True
+    try:
+        import ctypes
+        # The handle of the standard output, and its mode.
+        kernel32: Any = ctypes.windll.kernel32
+        handle: Any = kernel32.GetStdHandle(-11)
+        mode: Any = ctypes.c_uint32()
+        if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            # Add ENABLE_VIRTUAL_TERMINAL_PROCESSING.
+            kernel32.SetConsoleMode(handle, mode.value | 0x0004)
+    except (ImportError, AttributeError, OSError):
+        pass
+
+
 def clear() -> None:
     """Clears the screen.
     """
-    os.system('cls' if os.name == 'nt' else 'clear')
+    enable_ansi()
+    sys.stdout.write(CLEAR_SCREEN)
+    sys.stdout.flush()
+
+
+def read_key() -> str:
+    """Reads a single key press, without waiting for enter when possible.
+
+    Keys that send several characters, such as the arrows, are read whole,
+    so none of their sequence is left for the next read.
+
+    Returns:
+        str -- The key pressed, empty at the end of input.
+    """
+    if msvcrt is not None:
+        # The key pressed, or the prefix of a special key.
+        key: str = msvcrt.getwch()
+        if key in ('\x00', '\xe0'):
+            key += msvcrt.getwch()
+        return key
+    if termios is None or not sys.stdin.isatty():
+        return sys.stdin.readline()[:1]
+    # The file descriptor of the terminal.
+    fd: int = sys.stdin.fileno()
+    # The terminal settings to restore.
+    settings: List[Any] = termios.tcgetattr(fd)
+    try:
+        tty.setcbreak(fd)
+        # The terminal sends a whole key press in one write.
+        return os.read(fd, KEY_READ_SIZE).decode('utf-8', 'replace')
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, settings)
 
 
 def pause() -> None:
     """Prompts the user to press any key to continue.
     """
-    os.system('pause' if os.name == 'nt' else
-              'read -n1 -r -p "Press any key to continue . . . " key')
+    sys.stdout.write('Press any key to continue . . . ')
+    sys.stdout.flush()
+    read_key()
+    print()
@@ -2,131 +2,604 @@
 """
 Author   : Evan Elias Young
 Date     : 2020-03-14
-Revision : 2020-03-14
+Revision : 2026-10-18
 """
 
 from constants import *
-from typing import Optional, Union, List, Dict, Any
-import requests
-import json
+from typing import Optional, Union, List, Dict, Any, Iterable, Iterator, Set
+from typing import Tuple, Type
+from concurrent.futures import Future, ThreadPoolExecutor
+from codec import loads
+from cache import cache_key
+from client import iTunesClient, get_client
 from results import AlbumResult, ArtistResult, TrackResult, iTunesResponse, iTunesResult
+from results import result_id, result_kind
 from album import Album
 from artist import Artist
 from track import Track
+from identity import IdentityMap, EntityMemo
+from lazy import LazyResults
+from index import LocalIndex, entity_wrappers
+from stream import stream_results
 
+# The entity class built for each wrapper type.
+ENTITY_TYPES: Dict[str, Type[Union[Artist, Album, Track]]] = {
+    'artist': Artist,
+    'collection': Album,
+    'audiobook': Album,
+    'track': Track
+}
+# The memo search_entities goes through, None to always build.
+entity_memo: Optional[EntityMemo] = None
 
-def lookup(
-        uid: int) -> Optional[iTunesResult]:
-    """Sends a lookup request with a given id.
+
+def lookup(uid: Union[int, str],
+           client: Optional[iTunesClient] = None,
+           entity: Optional[str] = None,
+           limit: Optional[int] = None) -> List[iTunesResult]:
+    """Sends a lookup request and returns every result.
 
     Arguments:
-        uid {int} -- The entity id.
+        uid {Union[int, str]} -- The entity id, or comma-joined ids.
+
+    Keyword Arguments:
+        client {Optional[iTunesClient]} -- The client to send the request with. (default: {None})
+        entity {Optional[str]} -- The related entity type(s) to return as well, such as album or song. (default: {None})
+        limit {Optional[int]} -- The max number of related results. (default: {None})
 
     Returns:
-        Optional[iTunesResult] -- The raw data returned by iTunes.
+        List[iTunesResult] -- The raw data returned by iTunes, the looked up entities first.
     """
-    data: Optional[iTunesResult] = None
-    try:
-        response: requests.Response = requests.get(
-            'https://itunes.apple.com/lookup', params={'id': uid})
-        data = json.loads(response.content.decode('utf-8'))['results'][0]
-    except:
-        data = None
-    return data
+    # The lookup parameters.
+    params: Dict[str, Any] = {'id': uid}
+    if entity:
+        params['entity'] = entity
+    if limit:
+        params['limit'] = limit
+    # The client to send the request with.
+    cl: iTunesClient = get_client(client)
+    # The response body for the request.
+    body: bytes = cl.get('lookup', params)
+    with cl.metrics.timer('decode_seconds', endpoint='lookup'):
+        return loads(body)['results']
+
+
+def lookup_related(
+        ids: Iterable[int],
+        entity: str,
+        limit: Optional[int] = None,
+        client: Optional[iTunesClient] = None,
+        chunk_size: int = RELATED_CHUNK_SIZE
+) -> Dict[int, Tuple[Optional[iTunesResult], List[iTunesResult]]]:
+    """Sends batched lookup requests for the related entities of many ids.
+
+    Arguments:
+        ids {Iterable[int]} -- The artist or album ids.
+        entity {str} -- The related entity type(s), such as album or song.
 
+    Keyword Arguments:
+        limit {Optional[int]} -- The max number of related results per id. (default: {None})
+        client {Optional[iTunesClient]} -- The client to send the requests with. (default: {None})
+        chunk_size {int} -- The max number of ids per request. (default: {RELATED_CHUNK_SIZE})
 
-def lookup_entity(uid: int) -> Optional[Union[Artist, Album, Track]]:
+    Returns:
+        Dict[int, Tuple[Optional[iTunesResult], List[iTunesResult]]] -- The raw parent and related results by id, None for ids iTunes did not return.
+    """
+    # The parent and related results by id.
+    found: Dict[int, Tuple[Optional[iTunesResult], List[iTunesResult]]] = {}
+
+    for chunk in chunk_ids(ids, chunk_size):
+        # The parent results by id.
+        parents: Dict[int, Optional[iTunesResult]] = dict.fromkeys(chunk)
+        # The related results by parent id.
+        related: Dict[int, List[iTunesResult]] = {uid: [] for uid in chunk}
+        # The raw results of the chunk.
+        results: List[iTunesResult] = lookup(
+            ','.join(str(uid) for uid in chunk), client, entity, limit)
+        for raw_ent in results:
+            if result_id(raw_ent) in parents and \
+                    parents[result_id(raw_ent)] is None:
+                parents[result_id(raw_ent)] = raw_ent
+        for raw_ent in results:
+            if parents.get(result_id(raw_ent)) is raw_ent:
+                continue
+            # The album it belongs to, or else the artist.
+            parent: Optional[int] = raw_ent.get('collectionId')
+            if raw_ent['wrapperType'] != 'track' or parent not in related:
+                parent = raw_ent.get('artistId')
+            if parent in related:
+                related[parent].append(raw_ent)
+        found.update((uid, (parents[uid], related[uid])) for uid in chunk)
+    return found
+
+
+def lookup_entity(
+        uid: int,
+        client: Optional[iTunesClient] = None
+) -> Optional[Union[Artist, Album, Track]]:
     # Get the raw data.
-    data: Optional[iTunesResult] = lookup(uid)
+    data: Optional[iTunesResult] = None
+    try:
+        data = lookup(uid, client)[0]
+    except (IndexError, KeyError, ValueError):
+        # iTunes answered, but not with this id.
+        data = None
     entity: Optional[Union[Artist, Album, Track]] = None
+    # The client the request was sent with.
+    cl: iTunesClient = get_client(client)
     if data:
-        entity = derive_entity(data).from_result(data)
+        with cl.metrics.timer('build_seconds', endpoint='lookup'):
+            entity = build_entity(data, cl.identities)
     return entity
 
 
-def search(term: str, entity: str) -> iTunesResponse:
+def chunk_ids(ids: Iterable[int],
+              size: int = LOOKUP_CHUNK_SIZE) -> List[List[int]]:
+    """Splits ids into unique chunks small enough for one lookup request.
+
+    Arguments:
+        ids {Iterable[int]} -- The entity ids.
+
+    Keyword Arguments:
+        size {int} -- The max number of ids per chunk. (default: {LOOKUP_CHUNK_SIZE})
+
+    Returns:
+        List[List[int]] -- The chunks of ids.
+    """
+    return list(iter_chunk_ids(ids, size))
+
+
+def iter_chunk_ids(ids: Iterable[int],
+                   size: int = LOOKUP_CHUNK_SIZE) -> Iterator[List[int]]:
+    """Splits ids into unique chunks as the ids are read.
+
+    Arguments:
+        ids {Iterable[int]} -- The entity ids.
+
+    Keyword Arguments:
+        size {int} -- The max number of ids per chunk. (default: {LOOKUP_CHUNK_SIZE})
+
+    Returns:
+        Iterator[List[int]] -- Each chunk of ids, as soon as it is full.
+    """
+    # The ids already chunked.
+    seen: Set[int] = set()
+    # The ids of the current chunk.
+    chunk: List[int] = []
+    for uid in ids:
+        if uid in seen:
+            continue
+        seen.add(uid)
+        chunk.append(uid)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def lookup_many(
+        ids: Iterable[int],
+        client: Optional[iTunesClient] = None
+) -> Dict[int, Optional[iTunesResult]]:
+    """Sends batched lookup requests for many ids.
+
+    Arguments:
+        ids {Iterable[int]} -- The entity ids.
+
+    Keyword Arguments:
+        client {Optional[iTunesClient]} -- The client to send the requests with. (default: {None})
+
+    Returns:
+        Dict[int, Optional[iTunesResult]] -- The raw data by id, None for ids iTunes did not return.
+    """
+    # The raw data by id.
+    found: Dict[int, Optional[iTunesResult]] = {}
+
+    for chunk in chunk_ids(ids):
+        for uid in chunk:
+            found[uid] = None
+        for raw_ent in lookup(','.join(str(uid) for uid in chunk), client):
+            uid = result_id(raw_ent)
+            if uid in found and found[uid] is None:
+                found[uid] = raw_ent
+    return found
+
+
+def lookup_entities_many(
+    ids: Iterable[int],
+    client: Optional[iTunesClient] = None
+) -> Dict[int, Optional[Union[Artist, Album, Track]]]:
+    """Sends batched lookup requests for many ids.
+
+    Arguments:
+        ids {Iterable[int]} -- The entity ids.
+
+    Keyword Arguments:
+        client {Optional[iTunesClient]} -- The client to send the requests with. (default: {None})
+
+    Returns:
+        Dict[int, Optional[Union[Artist, Album, Track]]] -- The entities by id, None for ids iTunes did not return.
+    """
+    # The entities shared between the results.
+    idmap: IdentityMap = identities_for(client)
+    # The raw data by id.
+    found: Dict[int, Optional[iTunesResult]] = lookup_many(ids, client)
+    with get_client(client).metrics.timer('build_seconds', endpoint='lookup'):
+        return {
+            uid: build_entity(data, idmap) if data else None
+            for uid, data in found.items()
+        }
+
+
+def missing_ids(found: Dict[int, Any]) -> List[int]:
+    """Lists the ids a batched lookup could not find.
+
+    Arguments:
+        found {Dict[int, Any]} -- The result of a batched lookup.
+
+    Returns:
+        List[int] -- The ids iTunes did not return.
+    """
+    return [uid for uid, data in found.items() if data is None]
+
+
+def search(term: str,
+           entity: str,
+           client: Optional[iTunesClient] = None,
+           limit: int = SEARCH_LIMIT,
+           offset: int = 0,
+           country: str = SEARCH_COUNTRY) -> iTunesResponse:
     """Sends a search request with a given term and entity type.
 
     Arguments:
         term {str} -- The search term.
         entity {str} -- The entity type(s).
 
+    Keyword Arguments:
+        client {Optional[iTunesClient]} -- The client to send the request with. (default: {None})
+        limit {int} -- The max number of results. (default: {SEARCH_LIMIT})
+        offset {int} -- The number of results to skip. (default: {0})
+        country {str} -- The storefront to search. (default: {SEARCH_COUNTRY})
+
     Returns:
         iTunesResponse -- The raw data returned by iTunes.
     """
-    # The starting index of the actual data.
-    start: int = 13
-    # The ending index of the actual data.
-    stop: int = -5
+    # The client to send the request with.
+    cl: iTunesClient = get_client(client)
+    # The response body for the request.
+    body: bytes = cl.get(
+        'search', search_params(term, entity, limit, offset, country))
+    with cl.metrics.timer('decode_seconds', endpoint='search'):
+        return parse_search(body)
+
+
+def search_params(term: str,
+                  entity: str,
+                  limit: int = SEARCH_LIMIT,
+                  offset: int = 0,
+                  country: str = SEARCH_COUNTRY) -> Dict[str, str]:
+    """Builds the parameters of a search request.
+
+    Arguments:
+        term {str} -- The search term.
+        entity {str} -- The entity type(s).
+
+    Keyword Arguments:
+        limit {int} -- The max number of results. (default: {SEARCH_LIMIT})
+        offset {int} -- The number of results to skip. (default: {0})
+        country {str} -- The storefront to search. (default: {SEARCH_COUNTRY})
+
+    Returns:
+        Dict[str, str] -- The search parameters.
+    """
     # The search parameters.
     params: Dict[str, str] = {
         'output': 'json',
-        'callback': 'JSONP.run',
         'term': term,
-        'country': SEARCH_COUNTRY,
+        'country': country,
         'media': SEARCH_MEDIA,
         'entity': entity,
-        'limit': str(SEARCH_LIMIT),
+        'limit': str(limit),
         'lang': SEARCH_LANG
     }
-    # The response for the request.
-    response: requests.Response = requests.get(
-        'https://itunes.apple.com/search', params=params)
+    if offset:
+        params['offset'] = str(offset)
+    if SEARCH_JSONP:
+        params['callback'] = 'JSONP.run'
+    return params
+
+
+def parse_search(body: bytes) -> iTunesResponse:
+    """Parses the body of a search response.
+
+    Arguments:
+        body {bytes} -- The response body, as json or JSONP.
+
+    Returns:
+        iTunesResponse -- The raw data returned by iTunes.
+    """
     # The json data.
-    data: iTunesResponse = json.loads(
-        response.content.decode('utf-8')[start:stop])
+    data: iTunesResponse = loads(body)
     return data
 
 
-def search_entities(term: str,
-                    entity: str) -> List[Union[Artist, Album, Track]]:
+def search_entities(
+        term: str,
+        entity: str,
+        client: Optional[iTunesClient] = None,
+        limit: int = SEARCH_LIMIT) -> List[Union[Artist, Album, Track]]:
     """Sends a search request with a given term and entity type.
 
     Arguments:
         term {str} -- The search term.
         entity {str} -- The entity type(s).
 
+    Keyword Arguments:
+        client {Optional[iTunesClient]} -- The client to send the request with. (default: {None})
+        limit {int} -- The max number of results. (default: {SEARCH_LIMIT})
+
+    With a memo set through set_entity_memo, a response identical to one
+    already built returns the same entities again.
+
     Returns:
         List[Union[Artist, Album, Track]] -- A list of entities returned by iTunes.
     """
-    # Get the raw data.
-    data: iTunesResponse = search(term, entity)
+    # The client to send the request with.
+    cl: iTunesClient = get_client(client)
+    # The search parameters.
+    params: Dict[str, str] = search_params(term, entity, limit)
+    # The response body for the request.
+    body: bytes = cl.get('search', params)
+    # The memo to reuse the entities of an identical response from, if any.
+    memo: Optional[EntityMemo] = entity_memo
+    # The cache key of the request.
+    key: str = cache_key('search', params) if memo is not None else ''
     # Create the list of results.
-    results: List[Union[Artist, Album, Track]] = []
-    # The current entity when iterating.
-    cur_ent: Union[Artist, Album, Track]
+    results: Optional[List[Union[Artist, Album, Track]]] = memo.get(
+        key, body, cl.identities) if memo is not None else None
+    if results is not None:
+        return results
+    # Get the raw data.
+    with cl.metrics.timer('decode_seconds', endpoint='search'):
+        data: iTunesResponse = parse_search(body)
+    # The entities shared between the results.
+    idmap: IdentityMap = identities_for(client)
 
-    for raw_ent in data['results']:
-        cur_ent = derive_entity(raw_ent).from_result(raw_ent)
-        results.append(cur_ent)
+    with cl.metrics.timer('build_seconds', endpoint='search'):
+        results = [build_entity(raw_ent, idmap) for raw_ent in data['results']]
+    if memo is not None:
+        memo.put(key, body, cl.identities, results)
     return results
 
 
+def iter_search(
+        term: str,
+        entity: str,
+        max_results: Optional[int] = None,
+        client: Optional[iTunesClient] = None,
+        page_size: int = SEARCH_PAGE_SIZE
+) -> Iterator[Union[Artist, Album, Track]]:
+    """Streams the entities of a search, page by page.
+
+    The next page is fetched in the background while the current one is
+    consumed, and only one page of entities is alive at a time.
+
+    Arguments:
+        term {str} -- The search term.
+        entity {str} -- The entity type(s).
+
+    Keyword Arguments:
+        max_results {Optional[int]} -- The max number of entities, None for all. (default: {None})
+        client {Optional[iTunesClient]} -- The client to send the requests with. (default: {None})
+        page_size {int} -- The number of results per request. (default: {SEARCH_PAGE_SIZE})
+
+    Returns:
+        Iterator[Union[Artist, Album, Track]] -- The entities returned by iTunes, without duplicates.
+    """
+    # The wrapper types and ids already yielded.
+    seen: Set[Tuple[str, int]] = set()
+    # The offset of the next page.
+    offset: int = 0
+    # The executor fetching the next page.
+    executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1)
+    # The page being fetched.
+    page: Optional['Future[iTunesResponse]'] = executor.submit(
+        search, term, entity, client, page_size, offset)
+
+    try:
+        while page is not None:
+            # The raw data of the current page.
+            data: iTunesResponse = page.result()
+            offset += page_size
+            page = None
+            if len(data['results']) >= page_size and \
+                    (max_results is None or offset < max_results):
+                page = executor.submit(search, term, entity, client,
+                                       page_size, offset)
+            # The entities shared within the page.
+            idmap: IdentityMap = identities_for(client)
+            for raw_ent in data['results']:
+                if max_results is not None and len(seen) >= max_results:
+                    return
+                # The wrapper type and id of the result.
+                key: Tuple[str, int] = (raw_ent['wrapperType'],
+                                        result_id(raw_ent))
+                if key not in seen:
+                    seen.add(key)
+                    yield build_entity(raw_ent, idmap)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def stream_search(
+        term: str,
+        entity: str,
+        client: Optional[iTunesClient] = None,
+        limit: int = SEARCH_LIMIT,
+        country: str = SEARCH_COUNTRY
+) -> Iterator[Union[Artist, Album, Track]]:
+    """Sends a search request, building each entity as soon as it downloads.
+
+    Only the result being received is held in memory besides the entities,
+    rather than the whole body and its decoded data.
+
+    Arguments:
+        term {str} -- The search term.
+        entity {str} -- The entity type(s).
+
+    Keyword Arguments:
+        client {Optional[iTunesClient]} -- The client to send the request with. (default: {None})
+        limit {int} -- The max number of results. (default: {SEARCH_LIMIT})
+        country {str} -- The storefront to search. (default: {SEARCH_COUNTRY})
+
+    Returns:
+        Iterator[Union[Artist, Album, Track]] -- The entities returned by iTunes.
+    """
+    # The entities shared between the results.
+    idmap: IdentityMap = identities_for(client)
+    for raw_ent in stream_results(
+            'search', search_params(term, entity, limit, 0, country), client):
+        yield build_entity(raw_ent, idmap)
+
+
+def stream_lookup(
+        uid: Union[int, str],
+        entity: Optional[str] = None,
+        limit: Optional[int] = None,
+        client: Optional[iTunesClient] = None
+) -> Iterator[Union[Artist, Album, Track]]:
+    """Sends a lookup request, building each entity as soon as it downloads.
+
+    Arguments:
+        uid {Union[int, str]} -- The entity id, or comma-joined ids.
+
+    Keyword Arguments:
+        entity {Optional[str]} -- The related entity type(s) to return as well, such as album or song. (default: {None})
+        limit {Optional[int]} -- The max number of related results. (default: {None})
+        client {Optional[iTunesClient]} -- The client to send the request with. (default: {None})
+
+    Returns:
+        Iterator[Union[Artist, Album, Track]] -- The entities returned by iTunes.
+    """
+    # The lookup parameters.
+    params: Dict[str, Any] = {'id': uid}
+    if entity:
+        params['entity'] = entity
+    if limit:
+        params['limit'] = limit
+    # The entities shared between the results.
+    idmap: IdentityMap = identities_for(client)
+    for raw_ent in stream_results('lookup', params, client):
+        yield build_entity(raw_ent, idmap)
+
+
+def search_entities_local(
+        term: str,
+        entity: str,
+        index: LocalIndex,
+        client: Optional[iTunesClient] = None
+) -> List[Union[Artist, Album, Track]]:
+    """Searches the local index first, and iTunes only when nothing matches.
+
+    The results of a remote search are added to the index.
+
+    Arguments:
+        term {str} -- The search term.
+        entity {str} -- The entity type(s).
+        index {LocalIndex} -- The local index.
+
+    Keyword Arguments:
+        client {Optional[iTunesClient]} -- The client to send the request with. (default: {None})
+
+    Returns:
+        List[Union[Artist, Album, Track]] -- A list of entities, best matches first.
+    """
+    # The raw data, from the index if it has any match.
+    results: List[iTunesResult] = index.search(term, entity_wrappers(entity),
+                                               SEARCH_LIMIT)
+    if not results:
+        results = search(term, entity, client)['results']
+        index.add(results)
+    # The entities shared between the results.
+    idmap: IdentityMap = identities_for(client)
+    return [build_entity(raw_ent, idmap) for raw_ent in results]
+
+
+def search_entities_lazy(term: str,
+                         entity: str,
+                         client: Optional[iTunesClient] = None) -> LazyResults:
+    """Sends a search request, building each entity only when accessed.
+
+    Arguments:
+        term {str} -- The search term.
+        entity {str} -- The entity type(s).
+
+    Keyword Arguments:
+        client {Optional[iTunesClient]} -- The client to send the request with. (default: {None})
+
+    Returns:
+        LazyResults -- A view of the entities returned by iTunes.
+    """
+    return LazyResults(search(term, entity, client), build_entity,
+                       identities_for(client))
+
+
 def derive_entity(
-    data: iTunesResult
-) -> Union[Artist, Album, Track]:
-    """Derives the entity type given raw data from iTunes.
+        data: iTunesResult) -> Type[Union[Artist, Album, Track]]:
+    """Derives the entity class given raw data from iTunes.
+
+    Other wrapper types are built as the kind of entity their ids describe.
 
     Arguments:
         data {iTunesResult} -- The raw data returned by iTunes.
 
-    Raises:
-        NotImplementedError: An uncoded wrapper type was returned.
+    Returns:
+        Type[Union[Artist, Album, Track]] -- The entity class.
+    """
+    return ENTITY_TYPES.get(data['wrapperType']) or ENTITY_TYPES[result_kind(
+        data)]
+
+
+def set_entity_memo(memo: Optional[EntityMemo] = None) -> None:
+    """Sets the memo search_entities goes through.
+
+    Keyword Arguments:
+        memo {Optional[EntityMemo]} -- The memo, None to always build. (default: {None})
+    """
+    global entity_memo
+    entity_memo = memo
+
+
+def build_entity(data: iTunesResult,
+                 idmap: Optional[IdentityMap] = None
+                 ) -> Union[Artist, Album, Track]:
+    """Builds the entity for raw data from iTunes.
+
+    Arguments:
+        data {iTunesResult} -- The raw data returned by iTunes.
+
+    Keyword Arguments:
+        idmap {Optional[IdentityMap]} -- The entities to share parents with. (default: {None})
 
     Returns:
-        Union[Artist, Album, Track] -- The entity
+        Union[Artist, Album, Track] -- The entity.
     """
-    entity: Union[Artist, Album, Track]
-    if data['wrapperType'] == 'collection':
-        entity = Album()
-    elif data['wrapperType'] == 'track':
-        entity = Track()
-    elif data['wrapperType'] == 'artist':
-        entity = Artist()
-    else:
-        raise NotImplementedError(
-            f'"{data["wrapperType"]}" not a known wrapper type')
-    return entity
+    return derive_entity(data).from_result(data, idmap)
+
+
+def identities_for(client: Optional[iTunesClient] = None) -> IdentityMap:
+    """Gets the entities to share parents with for one response.
+
+    Keyword Arguments:
+        client {Optional[iTunesClient]} -- The client the response came from. (default: {None})
+
+    Returns:
+        IdentityMap -- The client's identity map, or a new one for the response.
+    """
+    # The identity map scoped to the client, if any.
+    idmap: Optional[IdentityMap] = get_client(client).identities
+    return idmap if idmap is not None else IdentityMap()
 
 
 def print_result(coll: Union[Artist, Album, Track]) -> None:
@@ -141,7 +614,7 @@ def print_result(coll: Union[Artist, Album, Track]) -> None:
         print(f'{coll.name[:MAX_NAME_LEN]:{MAX_NAME_LEN}}', end='...   ')
     else:
         print(f'{coll.name:{MAX_NAME_LEN}}', end=SPACES * 2)
-    if not isinstance(coll, Artist):
+    if coll.type != 'Artist':
         # not an artist, so it has an artist field.
         if len(coll.artist.name) > MAX_ARTIST_LEN:
             # artist name too big, trim it.